@@ -5,10 +5,11 @@ Simple Salesforce LoginEventStream to OpenSearch streamer for EC2
 import os
 import sys
 import time
+import asyncio
 import logging
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
 from config import Config
-from salesforce_client import SalesforceClient
+from salesforce_client import SalesforceClient, format_soql_datetime
 from opensearch_client import OpenSearchClient
 
 # Configure logging
@@ -23,12 +24,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class LoginEventStreamer:
+    # Small buffer lets the indexer absorb bursts without stalling the fetcher
+    EVENT_QUEUE_MAXSIZE = 4
+    
     def __init__(self):
         try:
             self.config = Config()
             self.sf_client = SalesforceClient(self.config)
             self.os_client = OpenSearchClient(self.config)
-            self.last_poll_time = datetime.utcnow() - timedelta(minutes=5)
+            self.last_poll_epoch = time.time() - 300
         except Exception as e:
             logger.error(f"Failed to initialize LoginEventStreamer: {e}")
             raise
@@ -48,42 +52,76 @@ class LoginEventStreamer:
             logger.error("Failed to connect to OpenSearch. Exiting.")
             sys.exit(1)
         
+        try:
+            asyncio.run(self._run_pipeline())
+        except KeyboardInterrupt:
+            logger.info("Received shutdown signal")
+    
+    async def _run_pipeline(self):
+        """Fetch from Salesforce and index to OpenSearch concurrently"""
+        queue = asyncio.Queue(maxsize=self.EVENT_QUEUE_MAXSIZE)
+        # Dedicated threads so a slow bulk write never holds up a Salesforce poll
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='salesforce-fetcher') as fetcher, \
+                ThreadPoolExecutor(max_workers=1, thread_name_prefix='opensearch-indexer') as indexer:
+            await asyncio.gather(self._fetch_loop(queue, fetcher), self._index_loop(queue, indexer))
+    
+    async def _fetch_loop(self, queue, executor):
+        """Producer: poll Salesforce and enqueue batches of events"""
         while True:
             try:
-                self.process_events()
-                time.sleep(self.config.poll_interval_seconds)
+                await self.process_events(queue, executor)
+                await asyncio.sleep(self._next_poll_delay())
                 
-            except KeyboardInterrupt:
-                logger.info("Received shutdown signal")
-                break
             except Exception as e:
                 logger.error(f"Error in processing loop: {e}", exc_info=True)
-                time.sleep(30)  # Wait before retrying on error
+                await asyncio.sleep(30)  # Wait before retrying on error
+    
+    def _next_poll_delay(self):
+        """Poll interval, stretched while the Salesforce API budget is nearly spent"""
+        if self.sf_client.is_api_usage_high():
+            logger.warning(
+                f"Salesforce API usage at {self.sf_client.api_usage}/{self.sf_client.api_limit}, "
+                f"slowing polling"
+            )
+            return self.config.poll_interval_seconds * 4
+        return self.config.poll_interval_seconds
+    
+    async def _index_loop(self, queue, executor):
+        """Consumer: bulk index queued batches while the next fetch runs"""
+        loop = asyncio.get_running_loop()
+        while True:
+            events = await queue.get()
+            try:
+                success = await loop.run_in_executor(executor, self.os_client.bulk_index_events, events)
+                if success:
+                    logger.info(f"Successfully processed {len(events)} login events")
+                else:
+                    logger.error(f"Failed to index {len(events)} events")
+            except Exception as e:
+                logger.error(f"Error indexing events: {e}", exc_info=True)
+            finally:
+                queue.task_done()
     
-    def process_events(self):
-        """Process a single batch of events"""
-        end_time = datetime.utcnow()
-        start_time = self.last_poll_time
+    async def process_events(self, queue, executor):
+        """Fetch a single batch of events and hand it to the indexer"""
+        end_epoch = time.time()
         
-        sf_start = start_time.strftime('%Y-%m-%dT%H:%M:%S.000Z')
-        sf_end = end_time.strftime('%Y-%m-%dT%H:%M:%S.000Z')
+        sf_start = format_soql_datetime(self.last_poll_epoch)
+        sf_end = format_soql_datetime(end_epoch)
         
         logger.debug(f"Polling for events from {sf_start} to {sf_end}")
         
-        # Fetch events from Salesforce
-        events = self.sf_client.get_login_events(sf_start, sf_end)
+        # Fetch events from Salesforce without blocking the indexer
+        loop = asyncio.get_running_loop()
+        events = await loop.run_in_executor(executor, self.sf_client.get_login_events, sf_start, sf_end)
         
         if events:
-            # Index to OpenSearch
-            success = self.os_client.bulk_index_events(events)
-            if success:
-                logger.info(f"Successfully processed {len(events)} login events")
-            else:
-                logger.error(f"Failed to index {len(events)} events")
+            # Blocks only when the indexer is EVENT_QUEUE_MAXSIZE batches behind
+            await queue.put(events)
         else:
             logger.debug("No new events found")
         
-        self.last_poll_time = end_time
+        self.last_poll_epoch = end_epoch
 
 if __name__ == "__main__":
     try:
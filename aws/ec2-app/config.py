@@ -2,10 +2,25 @@
 import os
 import json
 import boto3
+from functools import lru_cache
+from aws_secretsmanager_caching import SecretCache, SecretCacheConfig
 from dotenv import load_dotenv
 
 load_dotenv()
 
+@lru_cache(maxsize=None)
+def get_secrets_manager_client(region):
+    """Return a Secrets Manager client shared for the process lifetime"""
+    return boto3.client('secretsmanager', region_name=region)
+
+@lru_cache(maxsize=None)
+def get_secret_cache(region):
+    """Return a secret cache backed by the shared Secrets Manager client"""
+    return SecretCache(
+        config=SecretCacheConfig(max_cache_size=8),
+        client=get_secrets_manager_client(region)
+    )
+
 class Config:
     def __init__(self):
         # AWS Configuration
@@ -15,6 +30,9 @@ class Config:
         # Application Configuration
         self.opensearch_endpoint = os.getenv('OPENSEARCH_ENDPOINT')
         self.opensearch_index = os.getenv('OPENSEARCH_INDEX', 'salesforce-login-events')
+        self.opensearch_index_sentinel = os.getenv(
+            'OPENSEARCH_INDEX_SENTINEL', '/var/run/salesforce-streamer/.index-created'
+        )
         self.poll_interval_seconds = int(os.getenv('POLL_INTERVAL_SECONDS', '60'))
         
         # Salesforce Configuration
@@ -44,10 +62,8 @@ class Config:
             raise ValueError("SECRETS_MANAGER_SECRET_ARN environment variable required")
         
         try:
-            client = boto3.client('secretsmanager', region_name=self.aws_region)
-            response = client.get_secret_value(SecretId=self.secrets_manager_secret_arn)
-            
-            secret_data = json.loads(response['SecretString'])
+            secret_cache = get_secret_cache(self.aws_region)
+            secret_data = json.loads(secret_cache.get_secret_string(self.secrets_manager_secret_arn))
             
             self.salesforce_client_id = secret_data['client_id']
             self.salesforce_username = secret_data['username']
@@ -1,22 +1,84 @@
 """OpenSearch client for indexing login events"""
-import boto3
+import botocore.session
 import logging
-import requests
-from datetime import datetime
-from botocore.auth import SigV4Auth
-from botocore.awsrequest import AWSRequest
+import math
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timezone
+from opensearchpy import OpenSearch, RequestsHttpConnection, AWSV4SignerAuth, helpers
+from opensearchpy.exceptions import SerializationError, TransportError
+from opensearchpy.serializer import JSONSerializer
+from urllib.parse import urlparse
+
+# orjson speeds up the bulk NDJSON path; fall back to the stdlib-based
+# serializer where it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+class OrjsonSerializer(JSONSerializer):
+    """JSON serializer backed by orjson for the bulk NDJSON hot path"""
+    
+    def dumps(self, data):
+        if isinstance(data, str):
+            return data
+        try:
+            # The bulk helper measures and joins lines as str
+            return orjson.dumps(data, default=self.default).decode('utf-8')
+        except (TypeError, ValueError) as e:
+            raise SerializationError(data, e)
+    
+    def loads(self, s):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(s, e)
+
 class OpenSearchClient:
+    # Adaptive parallel_bulk sizing: targets start at the initial values and
+    # move between the min/max bounds based on observed chunk latency
+    BULK_INITIAL_DOCS = 1000
+    BULK_MIN_DOCS = 100
+    BULK_MAX_DOCS = 5000
+    BULK_INITIAL_BYTES = 15 * 1024 * 1024
+    BULK_MIN_BYTES = 1 * 1024 * 1024
+    BULK_MAX_BYTES = 50 * 1024 * 1024
+    BULK_SLOW_SECONDS = 2.0
+    BULK_FAST_SECONDS = 0.5
+    BULK_LATENCY_EMA_WEIGHT = 0.3
+    BULK_THROTTLE_STATUSES = (413, 429)
+    # Batches larger than this are treated as a backfill: refresh and
+    # replication are paused for the duration of the bulk and restored after
+    BACKFILL_THRESHOLD_DOCS = 10000
+    BACKFILL_SETTINGS = {"index": {"refresh_interval": "-1", "number_of_replicas": 0}}
+    # Settings for an append-heavy telemetry index: fewer refreshes means
+    # fewer tiny segments to merge later
+    INDEX_SETTINGS = {
+        "index": {
+            "refresh_interval": "30s",
+            "number_of_replicas": 1,
+            "translog.flush_threshold_size": "1gb"
+        }
+    }
+    BULK_THREAD_COUNT = 8
+    BULK_QUEUE_SIZE = 4
+    # Only return what we need to detect per-document failures
+    BULK_FILTER_PATH = 'errors,items.*.error,items.*.status'
+
     def __init__(self, config):
         self.config = config
-        self.session = boto3.Session()
-        self.credentials = self.session.get_credentials()
+        self._botocore_session = botocore.session.Session()
+        self._target_docs = self.BULK_INITIAL_DOCS
+        self._target_bulk_bytes = self.BULK_INITIAL_BYTES
+        self._bulk_latency_ema = None
+        self._index_ready = False
         
         # Validate OpenSearch endpoint configuration
         self._validate_config()
-        self._create_index_if_not_exists()
+        self.client = self._create_client()
     
     def _validate_config(self):
         """Validate OpenSearch configuration"""
@@ -34,108 +96,210 @@ class OpenSearchClient:
         logger.info(f"OpenSearch endpoint configured: {self.config.opensearch_endpoint}")
         logger.info(f"AWS region configured: {self.config.aws_region}")
     
-    def _make_authenticated_request(self, method, path, data=None):
-        """Make an authenticated request to OpenSearch"""
+    def _create_client(self):
+        """Create a SigV4-signed OpenSearch client with a pooled HTTP connection"""
+        endpoint = urlparse(self.config.opensearch_endpoint)
+        use_ssl = endpoint.scheme == 'https'
+        
+        # Keep the refreshable credentials object (not a frozen snapshot) so
+        # instance-role tokens rotated after ~1h are picked up when signing
+        credentials = self._botocore_session.get_credentials()
+        if credentials is None:
+            raise ValueError("No AWS credentials available for OpenSearch request signing")
+        
+        return OpenSearch(
+            hosts=[{'host': endpoint.hostname, 'port': endpoint.port or (443 if use_ssl else 80)}],
+            http_auth=AWSV4SignerAuth(credentials, self.config.aws_region, 'es'),
+            use_ssl=use_ssl,
+            verify_certs=True,
+            connection_class=RequestsHttpConnection,
+            serializer=OrjsonSerializer() if orjson else JSONSerializer(),
+            # gzip request bodies and ask for gzipped responses; the signer
+            # runs on the prepared request, so it hashes the compressed body
+            http_compress=True,
+            pool_maxsize=16,
+            max_retries=3,
+            retry_on_status=(429, 502, 503, 504),
+            timeout=30
+        )
+    
+    def _index_sentinel_key(self):
+        """Identify the index by domain and name, so a new domain is checked again"""
+        return f"{self.config.opensearch_endpoint.rstrip('/')}/{self.config.opensearch_index}"
+    
+    def _index_sentinel_matches(self):
+        """Check whether a previous run already verified the index exists"""
         try:
-            url = f"{self.config.opensearch_endpoint}{path}"
-            
-            # Validate URL construction
-            if not url.startswith(('http://', 'https://')):
-                raise ValueError(f"Invalid URL constructed: {url}")
-            
-            # Create AWS request
-            aws_request = AWSRequest(method=method, url=url, data=data)
-            
-            # Add authentication
-            SigV4Auth(self.credentials, 'es', self.config.aws_region).add_auth(aws_request)
-            
-            # Convert to requests format
-            headers = dict(aws_request.headers)
-            if data:
-                headers['Content-Type'] = 'application/json'
-            
-            logger.debug(f"Making {method} request to {url}")
-            response = requests.request(method, url, headers=headers, data=data, timeout=30)
-            return response
-            
-        except Exception as e:
-            logger.error(f"Failed to make authenticated request to {url}: {e}")
-            raise
+            with open(self.config.opensearch_index_sentinel) as f:
+                return f.read().strip() == self._index_sentinel_key()
+        except OSError:
+            return False
+    
+    def _mark_index_created(self):
+        """Record that the index exists so later process starts skip the check"""
+        self._index_ready = True
+        try:
+            with open(self.config.opensearch_index_sentinel, 'w') as f:
+                f.write(self._index_sentinel_key())
+        except OSError as e:
+            logger.warning(f"Could not write index sentinel {self.config.opensearch_index_sentinel}: {e}")
+    
+    def _ensure_index(self):
+        """Create the index on first use unless a sentinel says it already exists"""
+        if self._index_ready:
+            return
+        if self._index_sentinel_matches():
+            self._index_ready = True
+            return
+        self._create_index_if_not_exists()
     
     def _create_index_if_not_exists(self):
         """Create index with mapping if it doesn't exist"""
-        # Check if index exists
-        response = self._make_authenticated_request('HEAD', f'/{self.config.opensearch_index}')
-        if response.status_code == 404:
-            mapping = {
-                "mappings": {
-                    "properties": {
-                        "Id": {"type": "keyword"},
-                        "UserId": {"type": "keyword"},
-                        "Username": {"type": "keyword"},
-                        "LoginTime": {"type": "date"},
-                        "SourceIp": {"type": "ip"},
-                        "Status": {"type": "keyword"},
-                        "@timestamp": {"type": "date"}
-                    }
+        if self.client.indices.exists(index=self.config.opensearch_index):
+            self._mark_index_created()
+            return
+        
+        mapping = {
+            "settings": self.INDEX_SETTINGS,
+            "mappings": {
+                "properties": {
+                    "Id": {"type": "keyword"},
+                    "UserId": {"type": "keyword"},
+                    "Username": {"type": "keyword"},
+                    "LoginTime": {"type": "date"},
+                    "SourceIp": {"type": "ip"},
+                    "Status": {"type": "keyword"},
+                    "@timestamp": {"type": "date"}
                 }
             }
+        }
+        
+        try:
+            self.client.indices.create(index=self.config.opensearch_index, body=mapping)
+            logger.info(f"Created OpenSearch index: {self.config.opensearch_index}")
+            self._mark_index_created()
+        except Exception as e:
+            logger.error(f"Failed to create index: {e}")
+    
+    @contextmanager
+    def _backfill_settings(self):
+        """Pause refresh and replication during a large bulk, then restore the previous values"""
+        index = self.config.opensearch_index
+        current = self.client.indices.get_settings(index=index, flat_settings=True)
+        settings = current.get(index, {}).get('settings', {})
+        # A missing value restores to null, i.e. the cluster default
+        restore = {
+            'index.refresh_interval': settings.get('index.refresh_interval'),
+            'index.number_of_replicas': settings.get('index.number_of_replicas')
+        }
+        
+        self.client.indices.put_settings(index=index, body=self.BACKFILL_SETTINGS)
+        logger.info(f"Paused refresh and replicas on {index} for backfill")
+        try:
+            yield
+        finally:
+            self.client.indices.put_settings(index=index, body=restore)
+            logger.info(f"Restored refresh and replica settings on {index}")
+    
+    def _bulk_actions(self, events):
+        """Yield bulk index actions for the given events"""
+        # One ingestion timestamp for the whole batch
+        timestamp = datetime.now(timezone.utc)
+        
+        for event in events:
+            event['@timestamp'] = timestamp
             
-            import json
-            response = self._make_authenticated_request('PUT', f'/{self.config.opensearch_index}', json.dumps(mapping))
-            if response.status_code == 200:
-                logger.info(f"Created OpenSearch index: {self.config.opensearch_index}")
-            else:
-                logger.error(f"Failed to create index: {response.text}")
+            # _index comes from the request path, so each action line is just the _id
+            yield {
+                '_op_type': 'index',
+                '_id': event.get('Id'),
+                '_source': event
+            }
+    
+    def _adjust_bulk_targets(self, chunk_latency, throttled, failed):
+        """Shrink bulk chunks when OpenSearch is slow or pushing back, grow them when it is fast"""
+        if self._bulk_latency_ema is None:
+            self._bulk_latency_ema = chunk_latency
+        else:
+            weight = self.BULK_LATENCY_EMA_WEIGHT
+            self._bulk_latency_ema = weight * chunk_latency + (1 - weight) * self._bulk_latency_ema
+        
+        if throttled or self._bulk_latency_ema > self.BULK_SLOW_SECONDS:
+            self._target_docs = max(self.BULK_MIN_DOCS, self._target_docs // 2)
+            self._target_bulk_bytes = max(self.BULK_MIN_BYTES, self._target_bulk_bytes // 2)
+        elif not failed and self._bulk_latency_ema < self.BULK_FAST_SECONDS:
+            self._target_docs = min(self.BULK_MAX_DOCS, int(self._target_docs * 1.25))
+            self._target_bulk_bytes = min(self.BULK_MAX_BYTES, int(self._target_bulk_bytes * 1.25))
+        else:
+            return
+        
+        logger.debug(
+            f"Bulk targets now {self._target_docs} docs / {self._target_bulk_bytes} bytes "
+            f"(chunk latency EMA {self._bulk_latency_ema:.2f}s)"
+        )
     
     def bulk_index_events(self, events):
         """Bulk index events to OpenSearch"""
         if not events:
             return True
         
-        bulk_data = []
-        for event in events:
-            event['@timestamp'] = datetime.utcnow().isoformat()
-            
-            bulk_data.append({
-                "index": {
-                    "_index": self.config.opensearch_index,
-                    "_id": event.get('Id')
-                }
-            })
-            bulk_data.append(event)
+        chunk_size = self._target_docs
+        failed = 0
+        throttled = False
+        started = time.monotonic()
         
         try:
-            import json
-            bulk_json = '\n'.join([json.dumps(item) for item in bulk_data]) + '\n'
+            # Inside the try so a failure here still feeds the batch-size tuning
+            self._ensure_index()
             
-            response = self._make_authenticated_request('POST', '/_bulk', bulk_json)
-            
-            if response.status_code == 200:
-                result = response.json()
-                if result.get('errors'):
-                    logger.warning("Some events failed to index")
-                    return False
-                return True
+            if len(events) > self.BACKFILL_THRESHOLD_DOCS:
+                index_settings = self._backfill_settings()
             else:
-                logger.error(f"Failed to index events: {response.text}")
+                index_settings = nullcontext()
+            
+            with index_settings:
+                for ok, item in helpers.parallel_bulk(
+                    self.client,
+                    self._bulk_actions(events),
+                    index=self.config.opensearch_index,
+                    chunk_size=chunk_size,
+                    max_chunk_bytes=self._target_bulk_bytes,
+                    thread_count=self.BULK_THREAD_COUNT,
+                    queue_size=self.BULK_QUEUE_SIZE,
+                    raise_on_error=False,
+                    filter_path=self.BULK_FILTER_PATH
+                ):
+                    if not ok:
+                        failed += 1
+                        result = next(iter(item.values()), {})
+                        if result.get('status') in self.BULK_THROTTLE_STATUSES:
+                            throttled = True
+            
+            if failed:
+                logger.warning(f"{failed} of {len(events)} events failed to index")
                 return False
+            return True
             
+        except TransportError as e:
+            throttled = e.status_code in self.BULK_THROTTLE_STATUSES
+            failed = len(events)
+            logger.error(f"Failed to index events: {e}")
+            return False
         except Exception as e:
+            failed = len(events)
             logger.error(f"Failed to index events: {e}")
             return False
+        finally:
+            # Chunks are sent BULK_THREAD_COUNT at a time
+            waves = math.ceil(math.ceil(len(events) / chunk_size) / self.BULK_THREAD_COUNT)
+            self._adjust_bulk_targets((time.monotonic() - started) / waves, throttled, failed)
     
     def test_connection(self):
         """Test OpenSearch connection"""
         try:
-            response = self._make_authenticated_request('GET', '/')
-            if response.status_code == 200:
-                info = response.json()
-                logger.info(f"Connected to OpenSearch: {info.get('version', {}).get('number')}")
-                return True
-            else:
-                logger.error(f"OpenSearch connection test failed: {response.text}")
-                return False
+            info = self.client.info()
+            logger.info(f"Connected to OpenSearch: {info.get('version', {}).get('number')}")
+            return True
         except Exception as e:
             logger.error(f"OpenSearch connection test failed: {e}")
             return False
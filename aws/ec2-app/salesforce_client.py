@@ -3,16 +3,62 @@ import time
 import jwt
 import requests
 import logging
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from cryptography.hazmat.primitives import serialization
 
 logger = logging.getLogger(__name__)
 
+def format_soql_datetime(epoch):
+    """Format epoch seconds as a UTC SOQL datetime literal"""
+    t = time.gmtime(epoch)
+    return (f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}.000Z")
+
 class SalesforceClient:
+    # Access tokens are refreshed well before Salesforce's 2h session timeout
+    TOKEN_LIFETIME_SECONDS = 105 * 60
+    # Fraction of the daily API budget after which callers should back off
+    API_USAGE_THROTTLE_RATIO = 0.8
+    
+    # Only the fields the OpenSearch mapping types; anything else would be
+    # shipped, parsed and stored without being searchable
+    _SOQL_TEMPLATE = (
+        "SELECT Id, UserId, LoginTime, SourceIp, Status "
+        "FROM LoginHistory "
+        "WHERE LoginTime >= {start} AND LoginTime < {end} "
+        "ORDER BY LoginTime ASC"
+    )
+    
     def __init__(self, config):
         self.config = config
         self.access_token = None
         self.token_expires_at = None
+        self.api_usage = None
+        self.api_limit = None
+        self._session = self._create_session()
+        # The signing key is immutable for the process lifetime; parse the PEM once
+        self._private_key = serialization.load_pem_private_key(
+            self.config.salesforce_private_key.encode('utf-8'),
+            password=None
+        )
+    
+    def _create_session(self):
+        """Create a keep-alive HTTP session that retries throttled requests"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=[429, 502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
     
     def _create_jwt_assertion(self):
         """Create JWT assertion for authentication"""
@@ -26,12 +72,7 @@ class SalesforceClient:
             'iat': now
         }
         
-        private_key_obj = serialization.load_pem_private_key(
-            self.config.salesforce_private_key.encode('utf-8'),
-            password=None
-        )
-        
-        return jwt.encode(payload, private_key_obj, algorithm='RS256')
+        return jwt.encode(payload, self._private_key, algorithm='RS256')
     
     def authenticate(self):
         """Authenticate using JWT Bearer Token flow"""
@@ -43,7 +84,7 @@ class SalesforceClient:
                 'assertion': jwt_assertion
             }
             
-            response = requests.post(
+            response = self._session.post(
                 f"{self.config.salesforce_instance_url}/services/oauth2/token",
                 data=auth_data,
                 timeout=30
@@ -56,7 +97,7 @@ class SalesforceClient:
             
             auth_result = response.json()
             self.access_token = auth_result['access_token']
-            self.token_expires_at = datetime.now() + timedelta(hours=1, minutes=45)
+            self.token_expires_at = time.time() + self.TOKEN_LIFETIME_SECONDS
             
             logger.info("Successfully authenticated with Salesforce")
             
@@ -68,45 +109,75 @@ class SalesforceClient:
         """Check if token is still valid"""
         return (self.access_token and 
                 self.token_expires_at and 
-                datetime.now() < self.token_expires_at)
+                time.time() < self.token_expires_at)
     
     def ensure_authenticated(self):
         """Ensure we have a valid token"""
         if not self.is_token_valid():
             self.authenticate()
     
+    def _record_limit_info(self, response):
+        """Track API usage from the Sforce-Limit-Info header (api-usage=N/M)"""
+        limit_info = response.headers.get('Sforce-Limit-Info', '')
+        for part in limit_info.split(','):
+            name, _, value = part.strip().partition('=')
+            if name == 'api-usage' and '/' in value:
+                used, _, limit = value.partition('/')
+                try:
+                    self.api_usage, self.api_limit = int(used), int(limit)
+                except ValueError:
+                    logger.debug(f"Unparseable Sforce-Limit-Info header: {limit_info}")
+    
+    def is_api_usage_high(self):
+        """Check if the org is close to its API request limit"""
+        return bool(self.api_limit and
+                    self.api_usage / self.api_limit > self.API_USAGE_THROTTLE_RATIO)
+    
+    def _query_get(self, url, headers, params=None):
+        """Issue a query GET and record the org's API usage from the response"""
+        response = self._session.get(url, headers=headers, params=params, timeout=60)
+        self._record_limit_info(response)
+        return response
+    
     def get_login_events(self, start_time, end_time):
-        """Fetch login events from Salesforce"""
+        """Fetch login events from Salesforce, following queryMore cursors"""
         self.ensure_authenticated()
         
-        query = f"""
-        SELECT Id, UserId, LoginTime, LoginType, LoginUrl, 
-               SourceIp, Status, Browser, Platform, Application
-        FROM LoginHistory 
-        WHERE LoginTime >= {start_time} AND LoginTime < {end_time}
-        ORDER BY LoginTime ASC
-        """
+        query = self._SOQL_TEMPLATE.format(start=start_time, end=end_time)
         
         headers = {
             'Authorization': f'Bearer {self.access_token}',
             'Content-Type': 'application/json'
         }
         
-        response = requests.get(
+        response = self._query_get(
             f"{self.config.salesforce_instance_url}/services/data/v58.0/query",
-            headers=headers,
-            params={'q': query},
-            timeout=60
+            headers,
+            params={'q': query}
         )
         
-        if response.status_code != 200:
-            logger.error(f"SOQL query failed with status {response.status_code}")
-            logger.error(f"Query: {query}")
-            logger.error(f"Response body: {response.text}")
-            response.raise_for_status()
-        
-        result = response.json()
-        return result.get('records', [])
+        records = []
+        while True:
+            if response.status_code != 200:
+                logger.error(f"SOQL query failed with status {response.status_code}")
+                logger.error(f"Query: {query}")
+                logger.error(f"Response body: {response.text}")
+                response.raise_for_status()
+            
+            result = response.json()
+            for record in result.get('records', []):
+                # Drop the per-record {type, url} envelope before it reaches the index
+                record.pop('attributes', None)
+                records.append(record)
+            
+            next_records_url = result.get('nextRecordsUrl')
+            if result.get('done', True) or not next_records_url:
+                return records
+            
+            response = self._query_get(
+                f"{self.config.salesforce_instance_url}{next_records_url}",
+                headers
+            )
     
     def test_connection(self):
         """Test Salesforce connection"""
@@ -0,0 +1,78 @@
+# Packer template for the Salesforce streamer AMI
+# Bakes the application virtualenv so deploys only need to copy code.
+#
+# Usage (from aws/packer):
+#   packer init .
+#   packer build -var "aws_region=us-west-1" .
+# Then set ec2_ami_id in terraform.tfvars to the resulting AMI ID.
+
+packer {
+  required_plugins {
+    amazon = {
+      source  = "github.com/hashicorp/amazon"
+      version = ">= 1.2.0"
+    }
+  }
+}
+
+variable "aws_region" {
+  description = "AWS region to build the AMI in"
+  type        = string
+  default     = "us-west-1"
+}
+
+variable "project_name" {
+  description = "Project name for AMI naming"
+  type        = string
+  default     = "sf-opensearch-lab"
+}
+
+variable "instance_type" {
+  description = "Instance type used for the build"
+  type        = string
+  default     = "t3.micro"
+}
+
+source "amazon-ebs" "streamer" {
+  region        = var.aws_region
+  instance_type = var.instance_type
+  ssh_username  = "ec2-user"
+  ami_name      = "${var.project_name}-streamer-${formatdate("YYYYMMDDhhmmss", timestamp())}"
+
+  source_ami_filter {
+    filters = {
+      name                = "amzn2-ami-hvm-*-x86_64-gp2"
+      virtualization-type = "hvm"
+    }
+    owners      = ["amazon"]
+    most_recent = true
+  }
+
+  tags = {
+    Name    = "${var.project_name}-streamer"
+    Project = var.project_name
+  }
+}
+
+build {
+  sources = ["source.amazon-ebs.streamer"]
+
+  provisioner "file" {
+    source      = "../ec2-app/requirements.txt"
+    destination = "/tmp/requirements.txt"
+  }
+
+  provisioner "shell" {
+    inline = [
+      "sudo yum update -y",
+      "sudo yum install -y python3 python3-pip git",
+      "sudo useradd -m -s /bin/bash salesforce-streamer",
+      "sudo mkdir -p /opt/salesforce-streamer",
+      "sudo cp /tmp/requirements.txt /opt/salesforce-streamer/requirements.txt",
+      "sudo python3 -m venv /opt/salesforce-streamer/.venv",
+      "sudo /opt/salesforce-streamer/.venv/bin/pip install --upgrade pip",
+      "sudo /opt/salesforce-streamer/.venv/bin/pip install -r /opt/salesforce-streamer/requirements.txt",
+      "sudo chown -R salesforce-streamer:salesforce-streamer /opt/salesforce-streamer",
+    ]
+  }
+}
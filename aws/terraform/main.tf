@@ -97,6 +97,7 @@ module "ec2" {
   key_pair_name          = aws_key_pair.main.key_name
   iam_instance_profile   = module.iam.ec2_instance_profile_name
   
+  ami_id                 = var.ec2_ami_id
   instance_type          = var.ec2_instance_type
   opensearch_endpoint    = module.opensearch.endpoint
   salesforce_instance_url = var.salesforce_instance_url
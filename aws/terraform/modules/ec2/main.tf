@@ -25,7 +25,7 @@ locals {
 }
 
 resource "aws_instance" "main" {
-  ami                    = data.aws_ami.amazon_linux.id
+  ami                    = var.ami_id != "" ? var.ami_id : data.aws_ami.amazon_linux.id
   instance_type          = var.instance_type
   key_name              = var.key_pair_name
   subnet_id             = var.subnet_id
@@ -3,6 +3,12 @@ variable "project_name" {
   type        = string
 }
 
+variable "ami_id" {
+  description = "Pre-baked AMI ID for the instance (empty uses the latest Amazon Linux 2)"
+  type        = string
+  default     = ""
+}
+
 variable "instance_type" {
   description = "EC2 instance type"
   type        = string
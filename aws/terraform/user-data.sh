@@ -29,18 +29,26 @@ chown salesforce-streamer:salesforce-streamer /opt/salesforce-streamer
 # Clone application code (you'll need to set this up as a Git repo or use S3)
 cd /opt/salesforce-streamer
 
-# For now, create the application files directly
-cat > requirements.txt << 'EOF'
+# For now, create the application files directly (unless the AMI baked them).
+# Keep this list in sync with aws/ec2-app/requirements.txt
+[ -f requirements.txt ] || cat > requirements.txt << 'EOF'
 requests==2.31.0
 boto3==1.28.57
+aws-secretsmanager-caching==1.1.1.5
 opensearch-py==2.3.1
+orjson==3.9.7
 pyjwt[crypto]==2.8.0
 cryptography==41.0.7
-python-dotenv==1.0.0
+python-dotenv==0.21.1
+urllib3<2.0.0
 EOF
 
-# Install Python dependencies
-pip3 install -r requirements.txt
+# Install Python dependencies into the app virtualenv (already baked into the
+# Packer AMI, so this only runs on a stock Amazon Linux 2 image)
+if [ ! -x /opt/salesforce-streamer/.venv/bin/python ]; then
+    python3 -m venv /opt/salesforce-streamer/.venv
+    /opt/salesforce-streamer/.venv/bin/pip install -r requirements.txt
+fi
 
 # Set environment variables
 cat > /opt/salesforce-streamer/.env << 'EOF'
@@ -64,7 +72,10 @@ User=salesforce-streamer
 WorkingDirectory=/opt/salesforce-streamer
 Environment=PATH=/usr/local/bin:/usr/bin:/bin
 EnvironmentFile=/opt/salesforce-streamer/.env
-ExecStart=/usr/bin/python3 /opt/salesforce-streamer/app.py
+# Holds the index-created sentinel; kept across restarts, cleared on reboot
+RuntimeDirectory=salesforce-streamer
+RuntimeDirectoryPreserve=yes
+ExecStart=/opt/salesforce-streamer/.venv/bin/python /opt/salesforce-streamer/app.py
 Restart=always
 RestartSec=10
 
@@ -53,6 +53,12 @@ variable "ec2_instance_type" {
   default     = "t3.micro"
 }
 
+variable "ec2_ami_id" {
+  description = "Pre-baked streamer AMI from aws/packer (empty uses the latest Amazon Linux 2)"
+  type        = string
+  default     = ""
+}
+
 variable "poll_interval_seconds" {
   description = "Polling interval for Salesforce events"
   type        = number
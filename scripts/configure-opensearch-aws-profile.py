@@ -10,8 +10,13 @@ import os
 import sys
 import subprocess
 import json
+import configparser
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
+
+import boto3
+
+from terraform_env import TERRAFORM_ENV
 
 def run_command(cmd: list, capture_output: bool = True, check: bool = True, cwd: Optional[Path] = None, env: Optional[dict] = None) -> subprocess.CompletedProcess:
     """Run a command and return the result."""
@@ -33,18 +38,15 @@ def run_command(cmd: list, capture_output: bool = True, check: bool = True, cwd:
     
     return result
 
-def get_terraform_output(output_name: str, terraform_dir: Path) -> str:
-    """Get a specific Terraform output value."""
-    cmd = ["terraform", "output", "-raw", output_name]
-    result = run_command(cmd, cwd=terraform_dir)
-    return result.stdout.strip()
+def get_terraform_outputs(terraform_dir: Path) -> Dict[str, Any]:
+    """Get all Terraform output values with a single terraform invocation."""
+    cmd = ["terraform", "output", "-json", "-no-color"]
+    result = run_command(cmd, cwd=terraform_dir, env=TERRAFORM_ENV)
+    return {name: output["value"] for name, output in json.loads(result.stdout).items()}
 
 def get_aws_identity() -> Dict[str, str]:
     """Get current AWS identity information."""
-    cmd = ["aws", "sts", "get-caller-identity"]
-    result = run_command(cmd)
-    identity = json.loads(result.stdout)
-    return identity
+    return boto3.client("sts").get_caller_identity()
 
 def extract_role_info(master_user_arn: str) -> Dict[str, str]:
     """Extract role information from the master user ARN."""
@@ -97,27 +99,28 @@ def add_aws_profile(account_id: str, project_name: str, region: str) -> None:
     aws_config_path.parent.mkdir(exist_ok=True)
     
     profile_name = "sf-opensearch-role"
+    section = f"profile {profile_name}"
     role_arn = f"arn:aws:iam::{account_id}:role/{project_name}-ec2-role"
     
-    profile_config = f"""
-[profile {profile_name}]
-role_arn = {role_arn}
-source_profile = default
-region = {region}
-"""
+    # Check if profile already exists (tolerate duplicate sections left by older runs)
+    existing = configparser.ConfigParser(strict=False, interpolation=None)
+    existing.read(aws_config_path)
     
-    # Check if profile already exists
-    if aws_config_path.exists():
-        with open(aws_config_path, 'r') as f:
-            content = f.read()
-        
-        if f"[profile {profile_name}]" in content:
-            print(f"⚠️  Profile '{profile_name}' already exists in {aws_config_path}")
-            return
+    if existing.has_section(section):
+        print(f"⚠️  Profile '{profile_name}' already exists in {aws_config_path}")
+        return
+    
+    profile = configparser.ConfigParser(interpolation=None)
+    profile[section] = {
+        "role_arn": role_arn,
+        "source_profile": "default",
+        "region": region
+    }
     
-    # Append to config file
+    # Append only the new section so existing comments and formatting survive
     with open(aws_config_path, 'a') as f:
-        f.write(profile_config)
+        f.write("\n")
+        profile.write(f)
     
     print(f"✅ Added profile '{profile_name}' to {aws_config_path}")
 
@@ -177,8 +180,9 @@ def main():
     try:
         # Get configuration from Terraform
         print("📋 Getting configuration from Terraform outputs...")
-        master_user_arn = get_terraform_output("opensearch_master_user_arn", terraform_dir)
-        opensearch_endpoint = get_terraform_output("opensearch_endpoint", terraform_dir)
+        outputs = get_terraform_outputs(terraform_dir)
+        master_user_arn = outputs["opensearch_master_user_arn"]
+        opensearch_endpoint = outputs["opensearch_endpoint"]
         
         # Extract role information
         role_info = extract_role_info(master_user_arn)
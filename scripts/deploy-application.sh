@@ -14,23 +14,27 @@ OPENSEARCH_ENDPOINT=$(terraform output -raw opensearch_endpoint)
 SECRETS_ARN=$(terraform output -raw secrets_manager_secret_arn)
 SALESFORCE_INSTANCE_URL=$(terraform output -raw salesforce_instance_url)
 
+# Reuse one SSH connection for every ssh/scp call below
+SSH_OPTS="-i $PROJECT_ROOT/aws/certs/aws-ec2 -o StrictHostKeyChecking=no -o ControlMaster=auto -o ControlPath=/tmp/deploy-app-%r@%h:%p -o ControlPersist=60"
+trap 'ssh -o ControlPath=/tmp/deploy-app-%r@%h:%p -O exit ec2-user@$EC2_IP 2>/dev/null || true' EXIT
+
 echo "EC2 Instance IP: $EC2_IP"
 echo "OpenSearch Endpoint: $OPENSEARCH_ENDPOINT"
 
 # Wait for instance to be ready (if needed)
 echo "Checking EC2 instance connectivity..."
-if ! ssh -i $PROJECT_ROOT/aws/certs/aws-ec2 -o StrictHostKeyChecking=no -o ConnectTimeout=10 ec2-user@$EC2_IP "echo 'Instance is ready'" 2>/dev/null; then
+if ! ssh $SSH_OPTS -o ConnectTimeout=10 ec2-user@$EC2_IP "echo 'Instance is ready'" 2>/dev/null; then
     echo "Waiting for EC2 instance to be ready..."
     sleep 30
 fi
 
 # Deploy application code
 echo "Deploying application code to EC2..."
-scp -i $PROJECT_ROOT/aws/certs/aws-ec2 -o StrictHostKeyChecking=no \
+scp $SSH_OPTS \
     -r $PROJECT_ROOT/aws/ec2-app/ ec2-user@$EC2_IP:/tmp/
 
 # Install and start the application
-ssh -i $PROJECT_ROOT/aws/certs/aws-ec2 -o StrictHostKeyChecking=no ec2-user@$EC2_IP << EOF
+ssh $SSH_OPTS ec2-user@$EC2_IP << EOF
 # Create application directory and user
 sudo mkdir -p /opt/salesforce-streamer
 sudo useradd -r -s /bin/false salesforce-streamer || true
@@ -38,7 +42,6 @@ sudo chown salesforce-streamer:salesforce-streamer /opt/salesforce-streamer
 
 # Copy application files
 sudo cp /tmp/ec2-app/*.py /opt/salesforce-streamer/
-sudo cp /tmp/ec2-app/requirements.txt /opt/salesforce-streamer/
 sudo cp /tmp/ec2-app/systemd/salesforce-streamer.service /etc/systemd/system/
 
 # Create environment file
@@ -55,10 +58,16 @@ ENVEOF
 sudo chown -R salesforce-streamer:salesforce-streamer /opt/salesforce-streamer/
 sudo chmod 600 /opt/salesforce-streamer/.env
 
-# Reload systemd and install dependencies
+# Reload systemd and install dependencies into the app virtualenv. They are
+# baked into the AMI, so only reinstall when requirements.txt changed; the
+# new list is recorded only after a successful install
 sudo systemctl daemon-reload
 cd /opt/salesforce-streamer
-sudo pip3 install -r requirements.txt
+if [ ! -x .venv/bin/python ] || ! cmp -s /tmp/ec2-app/requirements.txt requirements.txt; then
+    [ -x .venv/bin/python ] || sudo python3 -m venv .venv
+    sudo .venv/bin/pip install -r /tmp/ec2-app/requirements.txt
+    sudo cp /tmp/ec2-app/requirements.txt requirements.txt
+fi
 
 # Restart the service
 sudo systemctl stop salesforce-streamer || true
@@ -6,12 +6,37 @@ This script automates the deployment of the Salesforce streaming application
 to AWS EC2 infrastructure using Terraform.
 """
 
+import asyncio
+import io
+import socket
 import subprocess
 import sys
+import tarfile
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
+
+import asyncssh
+
+from terraform_env import TERRAFORM_ENV
+
+
+# Paths are resolved from this file so they do not depend on the working directory
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+SSH_KEY = str(PROJECT_ROOT / "aws" / "certs" / "aws-ec2")
+APP_DIR = str(PROJECT_ROOT / "aws" / "ec2-app")
+
+# Terraform's default of 10 concurrent resource operations leaves the
+# EC2/OpenSearch/networking graph under-parallelized
+TERRAFORM_PARALLELISM = int(os.environ.get("TERRAFORM_PARALLELISM", "24"))
+
+# Saved plan handed from plan to apply, relative to aws/terraform
+TERRAFORM_PLAN_FILE = Path(".terraform") / "deploy.tfplan"
+
+# Poll interval for the TCP readiness check before the first SSH login attempt
+PORT_POLL_INTERVAL = 0.1
 
 
 class DeploymentError(Exception):
@@ -19,27 +44,57 @@ class DeploymentError(Exception):
     pass
 
 
-def run_command(command: str, cwd: Optional[str] = None, check: bool = True) -> subprocess.CompletedProcess:
+def run_command(
+    command: List[str],
+    cwd: Optional[str] = None,
+    check: bool = True,
+    stream: bool = False,
+    env: Optional[dict] = None
+) -> subprocess.CompletedProcess:
     """
-    Run a shell command and return the result.
+    Run a command and return the result.
     
     Args:
-        command: The command to run
+        command: The command to run, as an argv list (no shell is involved)
         cwd: Working directory for the command
         check: Whether to raise an exception on non-zero exit code
+        stream: Print output line by line as it arrives instead of capturing
+            it (for long-running commands like terraform plan/apply)
+        env: Environment for the command (defaults to the current one)
         
     Returns:
         CompletedProcess object with stdout, stderr, and returncode
+        (stdout and stderr are None when streaming)
         
     Raises:
-        DeploymentError: If command fails and check=True
+        DeploymentError: If the command is not installed, or fails and check=True
     """
-    print(f"Running: {command}")
+    print(f"Running: {' '.join(command)}")
+    if stream:
+        try:
+            with subprocess.Popen(
+                command,
+                cwd=cwd,
+                env=env,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=1,
+                text=True
+            ) as proc:
+                for line in proc.stdout:
+                    print(line, end="", flush=True)
+        except FileNotFoundError:
+            raise DeploymentError(f"Command not found: {command[0]}")
+        if check and proc.returncode != 0:
+            print(f"Command failed with exit code {proc.returncode}")
+            raise DeploymentError(f"Command failed: {' '.join(command)}")
+        return subprocess.CompletedProcess(command, proc.returncode)
+    
     try:
         result = subprocess.run(
             command,
-            shell=True,
             cwd=cwd,
+            env=env,
             check=check,
             capture_output=True,
             text=True
@@ -47,11 +102,13 @@ def run_command(command: str, cwd: Optional[str] = None, check: bool = True) ->
         if result.stdout:
             print(result.stdout)
         return result
+    except FileNotFoundError:
+        raise DeploymentError(f"Command not found: {command[0]}")
     except subprocess.CalledProcessError as e:
         print(f"Command failed with exit code {e.returncode}")
         if e.stderr:
             print(f"Error: {e.stderr}")
-        raise DeploymentError(f"Command failed: {command}")
+        raise DeploymentError(f"Command failed: {' '.join(command)}")
 
 
 def get_ec2_ip() -> str:
@@ -65,7 +122,9 @@ def get_ec2_ip() -> str:
         DeploymentError: If unable to get IP from Terraform
     """
     try:
-        result = run_command("terraform output -raw ec2_public_ip", cwd="aws/terraform")
+        result = run_command(
+            ["terraform", "output", "-raw", "ec2_public_ip"], cwd="aws/terraform", env=TERRAFORM_ENV
+        )
         ip = result.stdout.strip()
         if not ip:
             raise DeploymentError("No IP address returned from Terraform")
@@ -74,6 +133,79 @@ def get_ec2_ip() -> str:
         raise DeploymentError(f"Failed to get EC2 IP: {e}")
 
 
+def wait_for_port(host: str, port: int, timeout: float):
+    """
+    Wait until a TCP port accepts connections.
+    
+    Args:
+        host: Host to connect to
+        port: TCP port to probe
+        timeout: Maximum number of seconds to wait
+        
+    Raises:
+        DeploymentError: If the port is not open within the timeout
+    """
+    deadline = time.monotonic() + timeout
+    
+    while True:
+        try:
+            socket.create_connection((host, port), timeout=0.2).close()
+            return
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise DeploymentError(f"{host}:{port} not reachable after {timeout}s")
+            time.sleep(PORT_POLL_INTERVAL)
+
+
+async def ssh_login_ok(ec2_ip: str, ssh_key: str) -> bool:
+    """
+    Try one SSH login to the instance and run a no-op command.
+    
+    Args:
+        ec2_ip: The public IP address of the EC2 instance
+        ssh_key: Path to the SSH private key
+        
+    Returns:
+        True if the login and command succeeded
+    """
+    try:
+        async with asyncssh.connect(
+            ec2_ip, username="ec2-user", client_keys=[ssh_key], known_hosts=None,
+            connect_timeout=3
+        ) as connection:
+            result = await connection.run("true")
+        return result.exit_status == 0
+    except (OSError, asyncio.TimeoutError, asyncssh.Error):
+        return False
+
+
+def wait_for_ssh(ec2_ip: str, timeout: int = 120, interval: int = 2):
+    """
+    Wait until the EC2 instance accepts SSH logins.
+    
+    Port 22 is polled with cheap TCP connects first, so the SSH login probe
+    only starts once sshd is actually listening. The probe uses asyncssh, like
+    the deploy itself, instead of forking an ssh client per attempt.
+    
+    Args:
+        ec2_ip: The public IP address of the EC2 instance
+        timeout: Maximum number of seconds to wait
+        interval: Seconds to wait between login attempts
+        
+    Raises:
+        DeploymentError: If SSH is not ready within the timeout
+    """
+    deadline = time.monotonic() + timeout
+    wait_for_port(ec2_ip, 22, timeout)
+    
+    while True:
+        if asyncio.run(ssh_login_ok(ec2_ip, SSH_KEY)):
+            return
+        if time.monotonic() >= deadline:
+            raise DeploymentError(f"EC2 instance {ec2_ip} not reachable over SSH after {timeout}s")
+        time.sleep(interval)
+
+
 def deploy_infrastructure():
     """Deploy AWS infrastructure using Terraform."""
     print("Deploying infrastructure...")
@@ -81,68 +213,117 @@ def deploy_infrastructure():
     terraform_dir = "aws/terraform"
     
     # Initialize Terraform
-    run_command("terraform init", cwd=terraform_dir)
+    run_command(["terraform", "init"], cwd=terraform_dir, stream=True, env=TERRAFORM_ENV)
     
-    # Plan deployment
-    run_command("terraform plan -var-file='terraform.tfvars'", cwd=terraform_dir)
+    # Plan once and save it, so apply doesn't refresh and plan a second time
+    plan_file = Path(terraform_dir) / TERRAFORM_PLAN_FILE
+    try:
+        result = run_command(
+            [
+                "terraform", "plan", f"-parallelism={TERRAFORM_PARALLELISM}", "-var-file=terraform.tfvars",
+                "-detailed-exitcode", f"-out={TERRAFORM_PLAN_FILE}"
+            ],
+            cwd=terraform_dir,
+            check=False,
+            stream=True,
+            env=TERRAFORM_ENV
+        )
+        if result.returncode == 0:
+            print("Infrastructure is up to date, skipping apply")
+            return
+        if result.returncode != 2:
+            raise DeploymentError("Terraform plan failed")
+        
+        # Apply the saved plan (variables are already baked into it)
+        run_command(
+            ["terraform", "apply", f"-parallelism={TERRAFORM_PARALLELISM}", str(TERRAFORM_PLAN_FILE)],
+            cwd=terraform_dir,
+            stream=True,
+            env=TERRAFORM_ENV
+        )
+    finally:
+        plan_file.unlink(missing_ok=True)
+
+
+def build_app_archive(app_dir: str) -> bytes:
+    """
+    Package the application directory as an in-memory gzipped tarball.
     
-    # Apply deployment
-    run_command("terraform apply -var-file='terraform.tfvars'", cwd=terraform_dir)
+    Args:
+        app_dir: Directory containing the application code
+        
+    Returns:
+        The tar.gz archive contents
+    """
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as archive:
+        archive.add(app_dir, arcname=".")
+    return buffer.getvalue()
 
 
-def deploy_application(ec2_ip: str):
+async def deploy_remote(ec2_ip: str, ssh_key: str, archive: bytes, remote_command: str):
     """
-    Deploy application code to EC2 instance.
+    Upload the application archive and run the install over one SSH connection.
     
     Args:
         ec2_ip: The public IP address of the EC2 instance
+        ssh_key: Path to the SSH private key
+        archive: The tar.gz archive to feed to the remote command's stdin
+        remote_command: Shell command to run on the instance
+        
+    Raises:
+        DeploymentError: If the remote command fails
     """
-    print("Deploying application code to EC2...")
-    
-    # Check if SSH key exists
-    ssh_key = os.path.expanduser("../aws/certs/aws-ec2")
-    if not os.path.exists(ssh_key):
-        raise DeploymentError(f"SSH key not found at {ssh_key}")
+    print(f"Running on {ec2_ip}: {remote_command}")
+    async with asyncssh.connect(
+        ec2_ip, username="ec2-user", client_keys=[ssh_key], known_hosts=None
+    ) as connection:
+        result = await connection.run(remote_command, input=archive, encoding=None)
     
-    # Copy application files
-    scp_command = (
-        f"scp -i {ssh_key} -o StrictHostKeyChecking=no "
-        f"../aws/ec2-app/* ec2-user@{ec2_ip}:/tmp/"
-    )
-    run_command(scp_command)
+    if result.stdout:
+        print(result.stdout.decode(errors="replace"))
+    if result.exit_status != 0:
+        print(f"Command failed with exit code {result.exit_status}")
+        if result.stderr:
+            print(f"Error: {result.stderr.decode(errors='replace')}")
+        raise DeploymentError(f"Remote command failed: {remote_command}")
 
 
-def install_and_start_service(ec2_ip: str):
+def deploy_application(ec2_ip: str, archive: Optional[bytes] = None):
     """
-    Install dependencies and start the service on EC2.
+    Deploy application code to EC2, install dependencies and start the service.
+    
+    The code is streamed as a tarball over the same SSH session that runs the
+    install, so the whole remote setup is a single round-trip.
     
     Args:
         ec2_ip: The public IP address of the EC2 instance
+        archive: Prebuilt application archive; built from APP_DIR if omitted
     """
-    print("Installing dependencies and starting service...")
-    
-    ssh_key = os.path.expanduser("../aws/certs/aws-ec2")
+    print("Deploying application code and starting service on EC2...")
     
-    # SSH commands to run on the remote instance
-    ssh_commands = [
-        "sudo cp /tmp/*.py /opt/salesforce-streamer/",
-        "sudo cp /tmp/requirements.txt /opt/salesforce-streamer/",
+    # Commands to run on the remote instance after the upload is unpacked
+    remote_commands = [
+        "rm -rf /tmp/ec2-app",
+        "mkdir -p /tmp/ec2-app",
+        "tar xzf - -C /tmp/ec2-app",
+        "sudo cp /tmp/ec2-app/*.py /opt/salesforce-streamer/",
+        # Dependencies are baked into the AMI venv; only reinstall when they change,
+        # and record the new list only once the install succeeded
+        "(cmp -s /tmp/ec2-app/requirements.txt /opt/salesforce-streamer/requirements.txt"
+        " || (sudo /opt/salesforce-streamer/.venv/bin/pip install -r /tmp/ec2-app/requirements.txt"
+        " && sudo cp /tmp/ec2-app/requirements.txt /opt/salesforce-streamer/))",
         "sudo chown -R salesforce-streamer:salesforce-streamer /opt/salesforce-streamer/",
-        "cd /opt/salesforce-streamer",
-        "sudo pip3 install -r requirements.txt",
-        "sudo systemctl start salesforce-streamer",
+        "sudo systemctl restart salesforce-streamer",
         "sudo systemctl status salesforce-streamer"
     ]
     
     # Combine commands with && for proper error handling
-    combined_command = " && ".join(ssh_commands)
+    combined_command = " && ".join(remote_commands)
     
-    ssh_command = (
-        f"ssh -i {ssh_key} -o StrictHostKeyChecking=no "
-        f"ec2-user@{ec2_ip} '{combined_command}'"
-    )
-    
-    run_command(ssh_command)
+    if archive is None:
+        archive = build_app_archive(APP_DIR)
+    asyncio.run(deploy_remote(ec2_ip, SSH_KEY, archive, combined_command))
 
 
 def main():
@@ -150,10 +331,12 @@ def main():
     try:
         print("Deploying Salesforce to OpenSearch Lab Environment...")
         
+        # Check if SSH key exists before spending time on Terraform
+        if not os.path.exists(SSH_KEY):
+            raise DeploymentError(f"SSH key not found at {SSH_KEY}")
+        
         # Change to project root directory
-        script_dir = Path(__file__).parent
-        project_root = script_dir.parent
-        os.chdir(project_root)
+        os.chdir(PROJECT_ROOT)
         
         # Deploy infrastructure
         deploy_infrastructure()
@@ -162,18 +345,18 @@ def main():
         ec2_ip = get_ec2_ip()
         print(f"EC2 Instance IP: {ec2_ip}")
         
-        # Wait for instance to be ready
+        # Wait for instance to be ready while the application is packaged
         print("Waiting for EC2 instance to be ready...")
-        time.sleep(60)
-        
-        # Deploy application code
-        deploy_application(ec2_ip)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            ssh_ready = executor.submit(wait_for_ssh, ec2_ip)
+            archive = build_app_archive(APP_DIR)
+            ssh_ready.result()
         
-        # Install and start the service
-        install_and_start_service(ec2_ip)
+        # Upload application code, install and start the service
+        deploy_application(ec2_ip, archive)
         
         print("Deployment completed!")
-        print(f"SSH to instance: ssh -i ../aws/certs/aws-ec2 ec2-user@{ec2_ip}")
+        print(f"SSH to instance: ssh -i {SSH_KEY} ec2-user@{ec2_ip}")
         print("Check logs: sudo journalctl -u salesforce-streamer -f")
         
     except DeploymentError as e:
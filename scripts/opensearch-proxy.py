@@ -9,37 +9,218 @@ and accept SSH tunnel connections from local development machines.
 """
 
 import boto3
-from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+import atexit
+import http.client
 import json
 import logging
+import logging.handlers
 import os
 from pathlib import Path
-import requests
+import queue
+import socket
+import socketserver
+import ssl
 import subprocess
 import threading
+import time
 import sys
-from urllib.parse import urlparse, parse_qs
+from functools import lru_cache
 
-# Configure logging with more detail for remote debugging
+from sigv4_signing import CachedKeySigV4Auth
+from terraform_env import TERRAFORM_ENV
+
+# aiohttp is only needed for the optional --async server
+try:
+    import aiohttp
+    from aiohttp import web
+    from yarl import URL
+except ImportError:
+    aiohttp = None
+
+# Configure logging with more detail for remote debugging. Request threads
+# only enqueue records; a listener thread formats and writes them to the
+# file and stderr so handler threads never block on log I/O.
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler('/tmp/opensearch-proxy.log'),
+    logging.StreamHandler()
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/tmp/opensearch-proxy.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# TLS settings shared by every upstream connection (certificates are verified)
+SSL_CONTEXT = ssl.create_default_context()
+UPSTREAM_TIMEOUT = 30
+
+# The domain's load balancer drops keep-alive connections idle for ~60s;
+# pooled connections idle longer than this are discarded instead of reused
+UPSTREAM_IDLE_TIMEOUT = 55
+
+# CORS headers added to every response for Dashboards
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization'
+}
+
+# Cap on requests proxied at once; extra handler threads wait for a slot
+# instead of piling more connections onto the OpenSearch domain
+PROXY_MAX_INFLIGHT = int(os.environ.get('PROXY_MAX_INFLIGHT', '32'))
+_INFLIGHT = threading.BoundedSemaphore(PROXY_MAX_INFLIGHT)
+
+# Request headers copied from the client to OpenSearch (lower-cased)
+FORWARDED_HEADERS = frozenset({'content-type', 'accept', 'user-agent'})
+
+# Upstream response headers not relayed to the client (lower-cased). Bodies are
+# streamed without a length, hop-by-hop headers do not apply to the client
+# connection, and Server/Date are set by the local server itself.
+EXCLUDED_RESPONSE_HEADERS = frozenset({
+    'content-encoding', 'transfer-encoding', 'content-length',
+    'connection', 'keep-alive', 'server', 'date'
+})
+
+# Response bodies are relayed in chunks of this size instead of buffered whole
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Request bodies up to this size are buffered so they can be replayed on a
+# fresh connection if a pooled one turns out to be stale; larger ones stream
+REPLAYABLE_BODY_SIZE = STREAM_CHUNK_SIZE
+
+# Resolve AWS credentials and region once at startup. The credentials object
+# is refreshable, so role credentials are renewed as they approach expiry.
+_AWS_SESSION = boto3.Session()
+_CREDENTIALS = _AWS_SESSION.get_credentials()
+_REGION = _AWS_SESSION.region_name or 'us-west-1'
+_signer = None
+_signer_lock = threading.Lock()
+
+def get_signer():
+    """Return a SigV4 signer, rebuilt only when the underlying credentials rotate"""
+    global _signer
+    if _CREDENTIALS is None:
+        raise ValueError("No AWS credentials found for signing OpenSearch requests")
+    
+    frozen = _CREDENTIALS.get_frozen_credentials()
+    with _signer_lock:
+        if _signer is None or _signer.credentials != frozen:
+            _signer = CachedKeySigV4Auth(frozen, 'es', _REGION)
+        return _signer
+
+# SigV4 signatures are accepted for 5 minutes, so requests that Dashboards
+# repeats (polling the same APIs) reuse one signature per bucket
+SIGNATURE_BUCKET_SECONDS = 60
+
+# Upstream traffic is always TLS, so bodies are sent as UNSIGNED-PAYLOAD
+# rather than SHA-256 hashed on every request. This also makes the signature
+# independent of the body, so requests with a body can share cached headers.
+UNSIGNED_PAYLOAD = 'UNSIGNED-PAYLOAD'
+
+@lru_cache(maxsize=256)
+def _cached_auth_headers(signer, method, url, bucket):
+    """Sign a request; cached per signer, method, URL and time bucket"""
+    aws_request = AWSRequest(method=method, url=url)
+    aws_request.headers['X-Amz-Content-SHA256'] = UNSIGNED_PAYLOAD
+    signer.add_auth(aws_request)
+    return tuple(aws_request.headers.items())
+
+def sign_request_headers(method, url):
+    """Return SigV4 auth headers for a request to OpenSearch"""
+    bucket = int(time.time() // SIGNATURE_BUCKET_SECONDS)
+    return dict(_cached_auth_headers(get_signer(), method, url, bucket))
+
+class RequestBodyStream:
+    """Reader over exactly content_length bytes of a client request body.
+    
+    The body is copied to OpenSearch chunk by chunk through a reused buffer,
+    so large bodies (e.g. _bulk) are never held in memory.
+    """
+    
+    def __init__(self, rfile, content_length):
+        self._rfile = rfile
+        self._remaining = content_length
+    
+    def readinto(self, buffer):
+        """Fill buffer with the next part of the body; returns 0 at the end"""
+        if self._remaining <= 0:
+            return 0
+        view = memoryview(buffer)[:min(len(buffer), self._remaining)]
+        count = self._rfile.readinto(view)
+        if not count:
+            raise ConnectionError("Client closed the connection before sending the full body")
+        self._remaining -= count
+        return count
+
+def copy_stream(readinto, write):
+    """Relay a stream through one reused buffer instead of a bytes object per chunk.
+    
+    Kernel splice() cannot be used here because the upstream leg is TLS, so
+    this keeps the user-space copy but drops the per-chunk allocations.
+    """
+    buffer = bytearray(STREAM_CHUNK_SIZE)
+    view = memoryview(buffer)
+    while True:
+        count = readinto(buffer)
+        if not count:
+            break
+        write(view[:count])
+
+class UpstreamConnectionPool:
+    """Keep-alive HTTPS connections to OpenSearch shared by all handler threads.
+    
+    Handler threads live for a single client connection, so connections are
+    pooled here rather than per thread, and TLS sessions to the domain are
+    reused across proxied requests.
+    """
+    
+    def __init__(self, host, size):
+        self.host = host
+        # (connection, time it was released) pairs
+        self._idle = queue.LifoQueue(maxsize=size)
+    
+    def connect(self):
+        """Open a new connection to the upstream host"""
+        return http.client.HTTPSConnection(self.host, timeout=UPSTREAM_TIMEOUT, context=SSL_CONTEXT)
+    
+    def acquire(self):
+        """Return (connection, reused), preferring the most recently idle one"""
+        while True:
+            try:
+                conn, released_at = self._idle.get_nowait()
+            except queue.Empty:
+                return self.connect(), False
+            # Skip connections the upstream has most likely closed already
+            if time.monotonic() - released_at < UPSTREAM_IDLE_TIMEOUT:
+                return conn, True
+            conn.close()
+    
+    def release(self, conn):
+        """Return a connection whose response was fully read to the pool"""
+        try:
+            self._idle.put_nowait((conn, time.monotonic()))
+        except queue.Full:
+            conn.close()
+
 class OpenSearchProxyHandler(BaseHTTPRequestHandler):
     """HTTP handler that proxies requests to OpenSearch with AWS authentication"""
     
-    def __init__(self, *args, opensearch_endpoint=None, **kwargs):
+    def __init__(self, *args, opensearch_endpoint=None, upstream_pool=None, **kwargs):
         self.opensearch_endpoint = opensearch_endpoint
+        self.upstream_pool = upstream_pool
         super().__init__(*args, **kwargs)
     
+    def log_message(self, format, *args):
+        """Route http.server's access log through the queued logger"""
+        logger.info("%s - %s", self.address_string(), format % args)
+    
     def do_GET(self):
         """Handle GET requests"""
         self._proxy_request('GET')
@@ -59,81 +240,112 @@ class OpenSearchProxyHandler(BaseHTTPRequestHandler):
     def do_OPTIONS(self):
         """Handle OPTIONS requests (CORS)"""
         self.send_response(200)
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-        self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
+        for header, value in CORS_HEADERS.items():
+            self.send_header(header, value)
         self.end_headers()
     
     def _proxy_request(self, method):
         """Proxy the request to OpenSearch with AWS authentication"""
+        with _INFLIGHT:
+            self._forward_request(method)
+    
+    def _write_upstream_request(self, conn, method, headers, body):
+        """Send the request line, headers and streamed body on a connection"""
+        conn.putrequest(method, self.path)
+        for header, value in headers.items():
+            conn.putheader(header, value)
+        conn.endheaders()
+        if isinstance(body, bytes):
+            conn.send(body)
+        elif body is not None:
+            copy_stream(body.readinto, conn.send)
+    
+    def _send_upstream(self, method, headers, body):
+        """Send the request on a pooled connection and return (connection, response)"""
+        conn, reused = self.upstream_pool.acquire()
         try:
-            # Get request body if present
+            self._write_upstream_request(conn, method, headers, body)
+            return conn, conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            # An idle keep-alive connection may have been closed by OpenSearch;
+            # retry once on a fresh one unless a streamed body was consumed
+            if not reused or isinstance(body, RequestBodyStream):
+                raise
+        except Exception:
+            conn.close()
+            raise
+        
+        conn = self.upstream_pool.connect()
+        try:
+            self._write_upstream_request(conn, method, headers, body)
+            return conn, conn.getresponse()
+        except Exception:
+            conn.close()
+            raise
+    
+    def _forward_request(self, method):
+        """Forward one request to OpenSearch and relay the response"""
+        try:
+            # Buffer small request bodies so they can be replayed; stream large
+            # ones (the payload is not signed)
             content_length = int(self.headers.get('Content-Length', 0))
-            post_data = self.rfile.read(content_length) if content_length > 0 else None
+            if content_length <= 0:
+                post_data = None
+            elif content_length <= REPLAYABLE_BODY_SIZE:
+                post_data = self.rfile.read(content_length)
+                if len(post_data) != content_length:
+                    raise ConnectionError("Client closed the connection before sending the full body")
+            else:
+                post_data = RequestBodyStream(self.rfile, content_length)
             
-            # Build target URL
+            # Build target URL (self.path already includes any query string)
             target_url = f"https://{self.opensearch_endpoint}{self.path}"
             
-            # Add query parameters
-            if self.path and '?' in self.path:
-                target_url = f"https://{self.opensearch_endpoint}{self.path}"
-            elif hasattr(self, 'query_string') and self.query_string:
-                target_url = f"https://{self.opensearch_endpoint}{self.path}?{self.query_string}"
-            
             logger.info(f"Proxying {method} {self.path} to {target_url}")
             
-            # Create authenticated request
-            aws_request = AWSRequest(method=method, url=target_url, data=post_data)
-            
-            # Get AWS credentials
-            session = boto3.Session()
-            credentials = session.get_credentials()
-            region = session.region_name or 'us-west-1'
-            
             # Sign the request
-            SigV4Auth(credentials, 'es', region).add_auth(aws_request)
-            
-            # Prepare headers
-            headers = dict(aws_request.headers)
+            headers = sign_request_headers(method, target_url)
             
             # Add required header for OpenSearch Dashboards
             headers['osd-xsrf'] = 'true'
             
             # Copy important headers from original request
-            for header in ['Content-Type', 'Accept', 'User-Agent']:
-                if header in self.headers:
-                    headers[header] = self.headers[header]
+            for header, value in self.headers.items():
+                if header.lower() in FORWARDED_HEADERS:
+                    headers[header] = value
+            if post_data is not None:
+                headers['Content-Length'] = str(content_length)
             
             # Make the request to OpenSearch
-            response = requests.request(
-                method=method,
-                url=target_url,
-                headers=headers,
-                data=post_data,
-                timeout=30,
-                verify=True
-            )
-            
-            # Send response back to client
-            self.send_response(response.status_code)
-            
-            # Copy response headers
-            for header, value in response.headers.items():
-                if header.lower() not in ['content-encoding', 'transfer-encoding']:
+            conn, response = self._send_upstream(method, headers, post_data)
+            reusable = False
+            try:
+                # Send response back to client
+                self.send_response(response.status)
+                
+                # Copy response headers. The body is relayed as it streams and
+                # the client reads until the connection closes.
+                for header, value in response.getheaders():
+                    if header.lower() not in EXCLUDED_RESPONSE_HEADERS:
+                        self.send_header(header, value)
+                
+                # Add CORS headers for Dashboards
+                for header, value in CORS_HEADERS.items():
                     self.send_header(header, value)
+                
+                self.end_headers()
+                
+                # Relay the response body as it arrives
+                copy_stream(response.readinto, self.wfile.write)
+                reusable = not response.will_close
+            finally:
+                if reusable:
+                    self.upstream_pool.release(conn)
+                else:
+                    conn.close()
             
-            # Add CORS headers for Dashboards
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Access-Control-Allow-Methods', 'GET, POST, PUT, DELETE, OPTIONS')
-            self.send_header('Access-Control-Allow-Headers', 'Content-Type, Authorization')
-            
-            self.end_headers()
-            
-            # Send response body
-            if response.content:
-                self.wfile.write(response.content)
-            
-            logger.info(f"Response: {response.status_code}")
+            logger.info(f"Response: {response.status}")
             
         except Exception as e:
             logger.error(f"Error proxying request: {e}")
@@ -141,8 +353,12 @@ class OpenSearchProxyHandler(BaseHTTPRequestHandler):
 
 def create_proxy_handler(opensearch_endpoint):
     """Create a proxy handler with the OpenSearch endpoint"""
+    upstream_pool = UpstreamConnectionPool(opensearch_endpoint, PROXY_MAX_INFLIGHT)
+    
     def handler(*args, **kwargs):
-        return OpenSearchProxyHandler(*args, opensearch_endpoint=opensearch_endpoint, **kwargs)
+        return OpenSearchProxyHandler(
+            *args, opensearch_endpoint=opensearch_endpoint, upstream_pool=upstream_pool, **kwargs
+        )
     return handler
 
 def get_opensearch_endpoint():
@@ -170,10 +386,12 @@ def get_opensearch_endpoint():
     try:
         terraform_dir = Path(__file__).parent.parent / "aws" / "terraform"
         if terraform_dir.exists():
-            original_cwd = os.getcwd()
-            os.chdir(terraform_dir)
-            terraform_outputs = subprocess.run(["terraform", "output", "-json"], capture_output=True, text=True)
-            os.chdir(original_cwd)
+            terraform_outputs = subprocess.run(
+                ["terraform", "output", "-json", "-no-color"],
+                cwd=terraform_dir,
+                env=TERRAFORM_ENV,
+                capture_output=True
+            )
             
             if terraform_outputs.returncode == 0:
                 terraform_outputs = json.loads(terraform_outputs.stdout)
@@ -185,14 +403,50 @@ def get_opensearch_endpoint():
     
     raise ValueError("No OpenSearch endpoint found. Set OPENSEARCH_ENDPOINT environment variable, create /opt/opensearch-proxy/config.json, or run from Terraform directory")
 
-def start_proxy_server(port=9200, opensearch_endpoint=None, bind_address='0.0.0.0'):
+class UnixThreadingHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server listening on a Unix domain socket"""
+    
+    address_family = socket.AF_UNIX
+    
+    def server_bind(self):
+        socketserver.TCPServer.server_bind(self)
+        self.server_name = self.server_address
+        self.server_port = 0
+    
+    def get_request(self):
+        # Unix peers have no address; report the socket path for request logs
+        request, _ = self.socket.accept()
+        return request, (self.server_address, 0)
+
+def bind_unix_socket_path(uds_path):
+    """Remove a stale socket file and return the path to bind"""
+    if os.path.exists(uds_path):
+        os.unlink(uds_path)
+    return uds_path
+
+def start_proxy_server(port=9200, opensearch_endpoint=None, bind_address='0.0.0.0', uds_path=None):
     """Start the proxy server"""
     if not opensearch_endpoint:
         opensearch_endpoint = get_opensearch_endpoint()
     
     handler_class = create_proxy_handler(opensearch_endpoint)
     
-    server = HTTPServer((bind_address, port), handler_class)
+    if uds_path:
+        server = UnixThreadingHTTPServer(bind_unix_socket_path(uds_path), handler_class)
+        os.chmod(uds_path, 0o600)
+        logger.info(f"Starting OpenSearch proxy server on unix:{uds_path}")
+        logger.info(f"Proxying requests to: https://{opensearch_endpoint}")
+        logger.info(f"Expose it locally with: socat TCP-LISTEN:8080,fork,bind=127.0.0.1 UNIX-CONNECT:{uds_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Shutting down proxy server...")
+            server.shutdown()
+        finally:
+            os.unlink(uds_path)
+        return
+    
+    server = ThreadingHTTPServer((bind_address, port), handler_class)
     logger.info(f"Starting OpenSearch proxy server on http://{bind_address}:{port}")
     logger.info(f"Proxying requests to: https://{opensearch_endpoint}")
     logger.info(f"Access Dashboards at: http://{bind_address}:{port}/_dashboards/")
@@ -204,8 +458,95 @@ def start_proxy_server(port=9200, opensearch_endpoint=None, bind_address='0.0.0.
         logger.info("Shutting down proxy server...")
         server.shutdown()
 
+async def _async_proxy_request(request):
+    """aiohttp handler that proxies a request to OpenSearch with AWS authentication"""
+    if request.method == 'OPTIONS':
+        return web.Response(status=200, headers=CORS_HEADERS)
+    
+    try:
+        # Stream the request body if present (the payload is not signed)
+        body = request.content if request.body_exists else None
+        target_url = f"https://{request.app['opensearch_endpoint']}{request.path_qs}"
+        
+        logger.info(f"Proxying {request.method} {request.path_qs} to {target_url}")
+        
+        # Signing is CPU-only and fast, so it runs inline on the event loop
+        headers = sign_request_headers(request.method, target_url)
+        headers['osd-xsrf'] = 'true'
+        for header, value in request.headers.items():
+            if header.lower() in FORWARDED_HEADERS:
+                headers[header] = value
+        if request.content_length is not None:
+            headers['Content-Length'] = str(request.content_length)
+        
+        # encoded=True keeps the path byte-for-byte as signed
+        async with request.app['client_session'].request(
+            request.method,
+            URL(target_url, encoded=True),
+            headers=headers,
+            data=body,
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as upstream:
+            response = web.StreamResponse(status=upstream.status)
+            for header, value in upstream.headers.items():
+                if header.lower() not in EXCLUDED_RESPONSE_HEADERS:
+                    response.headers.add(header, value)
+            response.headers.update(CORS_HEADERS)
+            
+            await response.prepare(request)
+            async for chunk in upstream.content.iter_chunked(STREAM_CHUNK_SIZE):
+                await response.write(chunk)
+            await response.write_eof()
+        
+        logger.info(f"Response: {upstream.status}")
+        return response
+        
+    except Exception as e:
+        logger.error(f"Error proxying request: {e}")
+        return web.Response(status=500, text=f"Proxy error: {str(e)}")
+
+# Upstream connection pool for the async server. Idle connections are kept
+# open across Dashboards' polling gaps so TLS handshakes are not repeated.
+ASYNC_CONNECTION_LIMIT = 100
+ASYNC_KEEPALIVE_SECONDS = 75
+
+def start_async_proxy_server(port=9200, opensearch_endpoint=None, bind_address='0.0.0.0', uds_path=None):
+    """Start the proxy server on a single asyncio event loop (requires aiohttp)"""
+    if aiohttp is None:
+        raise ValueError("The async proxy requires aiohttp: pip install aiohttp")
+    
+    if not opensearch_endpoint:
+        opensearch_endpoint = get_opensearch_endpoint()
+    
+    async def open_client_session(app):
+        connector = aiohttp.TCPConnector(
+            limit=ASYNC_CONNECTION_LIMIT,
+            keepalive_timeout=ASYNC_KEEPALIVE_SECONDS
+        )
+        app['client_session'] = aiohttp.ClientSession(connector=connector)
+    
+    async def close_client_session(app):
+        await app['client_session'].close()
+    
+    app = web.Application(client_max_size=0)
+    app['opensearch_endpoint'] = opensearch_endpoint
+    app.on_startup.append(open_client_session)
+    app.on_cleanup.append(close_client_session)
+    app.router.add_route('*', '/{tail:.*}', _async_proxy_request)
+    
+    if uds_path:
+        logger.info(f"Starting async OpenSearch proxy server on unix:{uds_path}")
+        logger.info(f"Proxying requests to: https://{opensearch_endpoint}")
+        web.run_app(app, path=bind_unix_socket_path(uds_path), print=None)
+        return
+    
+    logger.info(f"Starting async OpenSearch proxy server on http://{bind_address}:{port}")
+    logger.info(f"Proxying requests to: https://{opensearch_endpoint}")
+    logger.info(f"Access Dashboards at: http://{bind_address}:{port}/_dashboards/")
+    
+    web.run_app(app, host=bind_address, port=port, print=None)
+
 if __name__ == "__main__":
-    import sys
     import argparse
     
     parser = argparse.ArgumentParser(description='OpenSearch Proxy Server')
@@ -213,6 +554,10 @@ if __name__ == "__main__":
     parser.add_argument('--bind', '-b', default='0.0.0.0', help='Address to bind to (default: 0.0.0.0)')
     parser.add_argument('--endpoint', '-e', help='OpenSearch endpoint override')
     parser.add_argument('--local', action='store_true', help='Run in local mode (bind to localhost only)')
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help='Serve on a single asyncio event loop with aiohttp')
+    parser.add_argument('--uds', metavar='PATH',
+                        help='Listen on a Unix domain socket (e.g. /tmp/opensearch-proxy.sock) instead of TCP')
     
     args = parser.parse_args()
     
@@ -221,8 +566,10 @@ if __name__ == "__main__":
     
     logger.info(f"Starting proxy with arguments: port={args.port}, bind={bind_address}, endpoint={args.endpoint}")
     
+    server = start_async_proxy_server if args.use_async else start_proxy_server
+    
     try:
-        start_proxy_server(port=args.port, opensearch_endpoint=args.endpoint, bind_address=bind_address)
+        server(port=args.port, opensearch_endpoint=args.endpoint, bind_address=bind_address, uds_path=args.uds)
     except Exception as e:
         logger.error(f"Failed to start proxy server: {e}")
         sys.exit(1)
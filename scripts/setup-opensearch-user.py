@@ -4,37 +4,58 @@ Create OpenSearch User for Dashboard Access
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import base64
+import json
+import os
 import sys
 import subprocess
-import os
+from functools import lru_cache
 from pathlib import Path
 
-def get_terraform_output(output_name):
-    """Get a Terraform output value."""
+from terraform_env import TERRAFORM_ENV
+
+# Pooled session reused for every request to the OpenSearch endpoint
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
+
+@lru_cache(maxsize=1)
+def _all_terraform_outputs():
+    """Read every Terraform output with a single `terraform output -json` call."""
     try:
-        # Change to terraform directory
         terraform_dir = Path(__file__).parent.parent / "aws" / "terraform"
         
-        # Get the output value
         result = subprocess.run(
-            ["terraform", "output", "-raw", output_name],
+            ["terraform", "output", "-json", "-no-color"],
             cwd=terraform_dir,
+            env=TERRAFORM_ENV,
             capture_output=True,
-            text=True,
             timeout=30
         )
         
         if result.returncode == 0:
-            return result.stdout.strip()
+            # json.loads decodes the UTF-8 bytes itself
+            return {name: entry["value"] for name, entry in json.loads(result.stdout).items()}
         else:
-            print(f"❌ Failed to get Terraform output '{output_name}': {result.stderr}")
-            return None
+            print(f"❌ Failed to get Terraform outputs: {result.stderr.decode(errors='replace')}")
+            return {}
             
     except Exception as e:
-        print(f"❌ Error getting Terraform output '{output_name}': {e}")
+        print(f"❌ Error getting Terraform outputs: {e}")
+        return {}
+
+def get_terraform_output(output_name):
+    """Get a Terraform output value."""
+    value = _all_terraform_outputs().get(output_name)
+    if value is None:
+        print(f"❌ Terraform output '{output_name}' not found")
         return None
+    return str(value)
 
 def create_opensearch_user():
     # Get OpenSearch endpoint from Terraform outputs
@@ -81,8 +102,13 @@ def create_opensearch_user():
     }
     
     try:
-        # Test basic connectivity
-        response = requests.get(f"{endpoint}/", headers=headers, timeout=10)
+        # Test basic connectivity. Local cluster health is answered from the
+        # coordinating node's cached state; (connect, read) timeouts fail fast.
+        response = SESSION.get(
+            f"{endpoint}/_cluster/health?local=true",
+            headers=headers,
+            timeout=(3.05, 5)
+        )
         print(f"Status Code: {response.status_code}")
         
         if response.status_code == 200:
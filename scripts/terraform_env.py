@@ -0,0 +1,11 @@
+"""
+Environment for the helper scripts' Terraform invocations.
+
+Terraform runs non-interactively: no input prompts, no automation hints in
+the output, and no checkpoint (version/telemetry) request to HashiCorp.
+Pass it only to terraform commands, not to ssh/scp or other tools.
+"""
+
+import os
+
+TERRAFORM_ENV = {**os.environ, "TF_IN_AUTOMATION": "1", "TF_INPUT": "0", "CHECKPOINT_DISABLE": "1"}
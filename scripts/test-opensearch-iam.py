@@ -6,22 +6,36 @@ This script demonstrates how to make authenticated requests to OpenSearch using
 
 import boto3
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
-from botocore.auth import SigV4Auth
 from botocore.awsrequest import AWSRequest
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+
+from sigv4_signing import CachedKeySigV4Auth
+
+# Resolve AWS credentials and region once for all test requests
+AWS_SESSION = boto3.Session()
+CREDENTIALS = AWS_SESSION.get_credentials()
+REGION = AWS_SESSION.region_name or 'us-west-1'  # Default to us-west-1 if region is None
+SIGNER = CachedKeySigV4Auth(CREDENTIALS, 'es', REGION)
+
+# Pooled session so the test requests share one TLS connection
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, backoff_factor=0.1)
+))
 
 def make_authenticated_request(method, url, data=None):
     """Make an authenticated request to OpenSearch using AWS SigV4"""
     # Create AWS request
     aws_request = AWSRequest(method=method, url=url, data=data)
     
-    # Get credentials from boto3 session
-    session = boto3.Session()
-    credentials = session.get_credentials()
-    
     # Sign the request
-    region = session.region_name or 'us-west-1'  # Default to us-west-1 if region is None
-    SigV4Auth(credentials, 'es', region).add_auth(aws_request)
+    SIGNER.add_auth(aws_request)
     
     # Convert to requests format
     headers = dict(aws_request.headers)
@@ -29,9 +43,47 @@ def make_authenticated_request(method, url, data=None):
         headers['Content-Type'] = 'application/json'
     
     # Make the request
-    response = requests.request(method, url, headers=headers, data=data, timeout=30)
+    response = SESSION.request(method, url, headers=headers, data=data, timeout=30)
     return response
 
+class BodyFormat(Enum):
+    """How report_probe prints a successful response body"""
+    JSON = 'json'
+    TEXT = 'text'
+    NONE = 'none'
+
+def report_probe(title, response, success_lines, body_format=BodyFormat.JSON):
+    """Print the outcome of one read-only probe"""
+    print(f"\n{title}")
+    if isinstance(response, Exception):
+        print(f"❌ ERROR: {response}")
+        return
+    try:
+        print(f"Status Code: {response.status_code}")
+        if response.status_code == 200:
+            for line in success_lines:
+                print(line)
+            if body_format is BodyFormat.JSON:
+                print(f"Response: {json.dumps(response.json(), indent=2)}")
+            elif body_format is BodyFormat.TEXT:
+                print(f"Response:\n{response.text}")
+        else:
+            print(f"❌ FAILED: {response.text}")
+    except Exception as e:
+        print(f"❌ ERROR: {e}")
+
+def probe(url):
+    """GET one URL, returning the exception instead of raising it"""
+    try:
+        return make_authenticated_request('GET', url)
+    except Exception as e:
+        return e
+
+def run_probes(urls):
+    """Send independent GET probes concurrently; results come back in order"""
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        return list(executor.map(probe, urls))
+
 def test_opensearch_access():
     """Test various OpenSearch endpoints with IAM authentication"""
     
@@ -42,59 +94,32 @@ def test_opensearch_access():
     print(f"Endpoint: {opensearch_endpoint}")
     print("=" * 60)
     
+    # Tests 1-4 are read-only and independent, so they run concurrently
+    info, health, indices, dashboards = run_probes([
+        f"{opensearch_endpoint}/",
+        f"{opensearch_endpoint}/_cluster/health",
+        f"{opensearch_endpoint}/_cat/indices?v",
+        f"{opensearch_endpoint}/_dashboards/",
+    ])
+    
     # Test 1: Basic cluster info
-    print("\n1. Testing basic cluster info...")
-    try:
-        response = make_authenticated_request('GET', f"{opensearch_endpoint}/")
-        print(f"Status Code: {response.status_code}")
-        if response.status_code == 200:
-            print("✅ SUCCESS: Basic cluster access working")
-            print(f"Response: {json.dumps(response.json(), indent=2)}")
-        else:
-            print(f"❌ FAILED: {response.text}")
-    except Exception as e:
-        print(f"❌ ERROR: {e}")
+    report_probe("1. Testing basic cluster info...", info,
+                 ["✅ SUCCESS: Basic cluster access working"])
     
     # Test 2: Cluster health
-    print("\n2. Testing cluster health...")
-    try:
-        response = make_authenticated_request('GET', f"{opensearch_endpoint}/_cluster/health")
-        print(f"Status Code: {response.status_code}")
-        if response.status_code == 200:
-            print("✅ SUCCESS: Cluster health access working")
-            print(f"Response: {json.dumps(response.json(), indent=2)}")
-        else:
-            print(f"❌ FAILED: {response.text}")
-    except Exception as e:
-        print(f"❌ ERROR: {e}")
+    report_probe("2. Testing cluster health...", health,
+                 ["✅ SUCCESS: Cluster health access working"])
     
     # Test 3: List indices
-    print("\n3. Testing indices listing...")
-    try:
-        response = make_authenticated_request('GET', f"{opensearch_endpoint}/_cat/indices?v")
-        print(f"Status Code: {response.status_code}")
-        if response.status_code == 200:
-            print("✅ SUCCESS: Indices listing working")
-            print(f"Response:\n{response.text}")
-        else:
-            print(f"❌ FAILED: {response.text}")
-    except Exception as e:
-        print(f"❌ ERROR: {e}")
+    report_probe("3. Testing indices listing...", indices,
+                 ["✅ SUCCESS: Indices listing working"], body_format=BodyFormat.TEXT)
     
     # Test 4: Dashboards access
-    print("\n4. Testing Dashboards access...")
-    try:
-        response = make_authenticated_request('GET', f"{opensearch_endpoint}/_dashboards/")
-        print(f"Status Code: {response.status_code}")
-        if response.status_code == 200:
-            print("✅ SUCCESS: Dashboards access working")
-            print("Dashboards are accessible via IAM authentication")
-        else:
-            print(f"❌ FAILED: {response.text}")
-    except Exception as e:
-        print(f"❌ ERROR: {e}")
+    report_probe("4. Testing Dashboards access...", dashboards,
+                 ["✅ SUCCESS: Dashboards access working",
+                  "Dashboards are accessible via IAM authentication"], body_format=BodyFormat.NONE)
     
-    # Test 5: Create a test index
+    # Test 5: Create a test index (after the listing above, so it is not included)
     print("\n5. Testing index creation...")
     try:
         test_index = "test-iam-access"
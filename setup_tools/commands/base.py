@@ -3,6 +3,7 @@ Base command class and factory pattern implementation.
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, Type, Any, Optional
 from pathlib import Path
 import logging
@@ -13,6 +14,16 @@ from ..utils.shell_executor import ShellExecutor
 from ..utils.file_operations import FileOperations
 from ..utils.validators import Validators
 
+# The utility helpers hold no state beyond their flags, so every command shares them
+_FILE_OPS = FileOperations()
+_VALIDATORS = Validators()
+
+
+@lru_cache(maxsize=4)
+def _shell_executor(dry_run: bool, verbose: bool) -> ShellExecutor:
+    """Get the shared ShellExecutor for a dry-run/verbose combination."""
+    return ShellExecutor(dry_run=dry_run, verbose=verbose)
+
 
 class BaseCommand(ABC):
     """Abstract base class for all commands."""
@@ -22,9 +33,9 @@ class BaseCommand(ABC):
         self.dry_run = dry_run
         self.verbose = verbose
         self.logger = logging.getLogger(f'setup_tools.{self.__class__.__name__}')
-        self.shell = ShellExecutor(dry_run=dry_run, verbose=verbose)
-        self.file_ops = FileOperations()
-        self.validators = Validators()
+        self.shell = _shell_executor(bool(dry_run), bool(verbose))
+        self.file_ops = _FILE_OPS
+        self.validators = _VALIDATORS
     
     @abstractmethod
     def execute(self, **kwargs) -> Any:
@@ -55,15 +66,18 @@ class BaseCommand(ABC):
         """
         pass
     
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         """Get command description."""
-        return self.__class__.__doc__ or "No description available"
+        return cls.__doc__ or "No description available"
     
-    def get_required_args(self) -> list:
+    @classmethod
+    def get_required_args(cls) -> list:
         """Get list of required arguments."""
         return []
     
-    def get_optional_args(self) -> dict:
+    @classmethod
+    def get_optional_args(cls) -> dict:
         """Get dictionary of optional arguments with defaults."""
         return {}
 
@@ -122,12 +136,10 @@ class CommandFactory:
         Returns:
             Dictionary of command names and descriptions
         """
-        commands = {}
-        for name, command_class in cls._commands.items():
-            # Create a temporary instance to get description
-            temp_instance = command_class(None, dry_run=True, verbose=False)
-            commands[name] = temp_instance.get_description()
-        return commands
+        return {
+            name: command_class.get_description()
+            for name, command_class in cls._commands.items()
+        }
     
     @classmethod
     def get_command_info(cls, name: str) -> Dict[str, Any]:
@@ -147,13 +159,12 @@ class CommandFactory:
             raise CommandError(f"Unknown command: {name}")
         
         command_class = cls._commands[name]
-        temp_instance = command_class(None, dry_run=True, verbose=False)
         
         return {
             'name': name,
-            'description': temp_instance.get_description(),
-            'required_args': temp_instance.get_required_args(),
-            'optional_args': temp_instance.get_optional_args(),
+            'description': command_class.get_description(),
+            'required_args': command_class.get_required_args(),
+            'optional_args': command_class.get_optional_args(),
             'class': command_class
         }
 
@@ -15,10 +15,12 @@ from ...core.exceptions import CommandError
 class AnalyzeSecurityGroupsCommand(BaseCommand):
     """Analyze and optionally create permissive security group configurations for OpenSearch."""
 
-    def get_required_args(self) -> list:
+    @classmethod
+    def get_required_args(cls) -> list:
         return []
 
-    def get_optional_args(self) -> dict:
+    @classmethod
+    def get_optional_args(cls) -> dict:
         return {
             'service': 'Service to analyze (opensearch, ec2, bastion)',
             'create_permissive': 'Create maximally permissive security group rules',
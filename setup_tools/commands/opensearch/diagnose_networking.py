@@ -15,10 +15,12 @@ from ...core.exceptions import CommandError
 class DiagnoseOpenSearchNetworkingCommand(BaseCommand):
     """Diagnose OpenSearch networking configuration and identify VPC access issues."""
 
-    def get_required_args(self) -> list:
+    @classmethod
+    def get_required_args(cls) -> list:
         return []
 
-    def get_optional_args(self) -> dict:
+    @classmethod
+    def get_optional_args(cls) -> dict:
         return {
             'domain_name': 'OpenSearch domain name (auto-detected if not provided)',
             'region': 'AWS region (defaults to us-east-1)'
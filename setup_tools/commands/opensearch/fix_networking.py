@@ -16,10 +16,12 @@ from ...core.exceptions import CommandError
 class FixOpenSearchNetworkingCommand(BaseCommand):
     """Automatically fix OpenSearch networking issues using multiple strategies."""
 
-    def get_required_args(self) -> list:
+    @classmethod
+    def get_required_args(cls) -> list:
         return []
 
-    def get_optional_args(self) -> dict:
+    @classmethod
+    def get_optional_args(cls) -> dict:
         return {
             'mode': 'Fix mode: permissive, public, hybrid (default: permissive)',
             'domain_name': 'OpenSearch domain name (auto-detected if not provided)',
@@ -20,10 +20,12 @@ from ...core.exceptions import CommandError
 class TestOpenSearchConnectivityCommand(BaseCommand):
     """Test connectivity to OpenSearch from EC2 instances or current environment."""
 
-    def get_required_args(self) -> list:
+    @classmethod
+    def get_required_args(cls) -> list:
         return []
 
-    def get_optional_args(self) -> dict:
+    @classmethod
+    def get_optional_args(cls) -> dict:
         return {
             'domain_name': 'OpenSearch domain name (auto-detected if not provided)',
             'from_ec2': 'Test from EC2 instance instead of local environment',
@@ -168,15 +168,18 @@ class CreateIntegrationUserCommand(BaseCommand):
         integration_user_file = self.config.root_dir / self.config.salesforce.integration_user_def
         self.validators.validate_file_path(integration_user_file, must_exist=True)
     
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         """Get command description."""
         return "Create an integration user in the Salesforce scratch org"
     
-    def get_required_args(self) -> list:
+    @classmethod
+    def get_required_args(cls) -> list:
         """Get list of required arguments."""
         return []
     
-    def get_optional_args(self) -> dict:
+    @classmethod
+    def get_optional_args(cls) -> dict:
         """Get dictionary of optional arguments with defaults."""
         return {
             'contact_email': 'Contact email for the integration user (defaults to config)'
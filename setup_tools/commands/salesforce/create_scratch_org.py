@@ -134,15 +134,18 @@ class CreateScratchOrgCommand(BaseCommand):
         scratch_def_file = self.config.root_dir / self.config.salesforce.project_scratch_def
         self.validators.validate_file_path(scratch_def_file, must_exist=True)
     
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         """Get command description."""
         return "Create a Salesforce scratch org with specified name and duration"
     
-    def get_required_args(self) -> list:
+    @classmethod
+    def get_required_args(cls) -> list:
         """Get list of required arguments."""
         return []
     
-    def get_optional_args(self) -> dict:
+    @classmethod
+    def get_optional_args(cls) -> dict:
         """Get dictionary of optional arguments with defaults."""
         return {
             'org_name': 'Name for the scratch org (defaults to config)',
@@ -137,15 +137,18 @@ class DeployPermissionSetsCommand(BaseCommand):
         permission_sets_dir = salesforce_dir / "force-app" / "main" / "default" / "permissionsets"
         self.validators.validate_directory_path(permission_sets_dir, must_exist=True)
     
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         """Get command description."""
         return "Deploy Salesforce permission sets to scratch org"
     
-    def get_required_args(self) -> list:
+    @classmethod
+    def get_required_args(cls) -> list:
         """Get list of required arguments."""
         return []
     
-    def get_optional_args(self) -> dict:
+    @classmethod
+    def get_optional_args(cls) -> dict:
         """Get dictionary of optional arguments with defaults."""
         return {
             'environment': 'Environment name for org targeting (default: demo)'
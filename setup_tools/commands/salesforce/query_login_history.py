@@ -163,14 +163,17 @@ class QueryLoginHistoryCommand(BaseCommand):
         soql_dir = salesforce_dir / "scripts" / "soql"
         self.validators.validate_directory_path(soql_dir, must_exist=True)
     
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         """Get command description."""
         return "Query Salesforce login history and export to CSV files"
     
-    def get_required_args(self) -> list:
+    @classmethod
+    def get_required_args(cls) -> list:
         """Get list of required arguments."""
         return []
     
-    def get_optional_args(self) -> dict:
+    @classmethod
+    def get_optional_args(cls) -> dict:
         """Get dictionary of optional arguments with defaults."""
         return {}
@@ -171,15 +171,18 @@ class SetupCompleteSalesforceCommand(BaseCommand):
         salesforce_dir = self.config.root_dir / "salesforce"
         self.validators.validate_directory_path(salesforce_dir, must_exist=True)
     
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         """Get command description."""
         return "Complete Salesforce setup including scratch org, certificates, Connected App, and integration user"
     
-    def get_required_args(self) -> list:
+    @classmethod
+    def get_required_args(cls) -> list:
         """Get list of required arguments."""
         return []
     
-    def get_optional_args(self) -> dict:
+    @classmethod
+    def get_optional_args(cls) -> dict:
         """Get dictionary of optional arguments with defaults."""
         return {
             'contact_email': 'Contact email for Salesforce components (defaults to config)',
@@ -109,15 +109,18 @@ class SetupConnectedAppCommand(BaseCommand):
         connected_app_path = salesforce_dir / "force-app" / "main" / "default" / "connectedApps" / "AWS_Lambda_PubSub_App.connectedApp-meta.xml"
         self.validators.validate_file_path(connected_app_path, must_exist=True)
     
-    def get_description(self) -> str:
+    @classmethod
+    def get_description(cls) -> str:
         """Get command description."""
         return "Set up Salesforce Connected App and retrieve Consumer Key"
     
-    def get_required_args(self) -> list:
+    @classmethod
+    def get_required_args(cls) -> list:
         """Get list of required arguments."""
         return []
     
-    def get_optional_args(self) -> dict:
+    @classmethod
+    def get_optional_args(cls) -> dict:
         """Get dictionary of optional arguments with defaults."""
         return {
             'contact_email': 'Contact email for the Connected App (defaults to config)',
@@ -4,7 +4,6 @@ OpenSearch Dashboard Access Manager
 Provides multiple reliable methods for accessing OpenSearch Dashboards
 """
 
-import os
 import sys
 import json
 import time
@@ -24,6 +23,8 @@ from rich.prompt import Prompt, Confirm
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+from setup_tools.utils.file_operations import FileOperations
+
 console = Console()
 
 
@@ -37,10 +38,9 @@ class OpenSearchDashboardAccess:
     def get_opensearch_credentials(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """Get OpenSearch credentials from Terraform outputs."""
         try:
-            os.chdir(self.terraform_dir)
-            
             result = subprocess.run(
                 ["terraform", "output", "-json"],
+                cwd=self.terraform_dir,
                 capture_output=True,
                 text=True,
                 timeout=60
@@ -60,8 +60,6 @@ class OpenSearchDashboardAccess:
         except Exception as e:
             console.print(f"[red]❌ Error getting credentials: {e}[/red]")
             return None, None, None
-        finally:
-            os.chdir(self.project_root)
     
     def test_direct_access(self, endpoint: str, password: str) -> bool:
         """Test direct browser access to OpenSearch Dashboards."""
@@ -108,9 +106,6 @@ class OpenSearchDashboardAccess:
                 return False
             
             # Test OpenSearch access from EC2
-            credentials = f"os_admin:{password}"
-            encoded_credentials = base64.b64encode(credentials.encode()).decode()
-            
             result = subprocess.run(
                 [
                     "ssh", "-i", str(ssh_key),
@@ -192,7 +187,7 @@ if ssh_access:
     echo ""
     echo "2. Keep that terminal open"
     echo ""
-    echo "3. In your browser, go to: https://localhost:9200/_dashboards/"
+    echo "3. In your browser, go to: http://localhost:9200/_dashboards/"
     echo ""
     echo "4. Login with:"
     echo "   Username: os_admin"
@@ -243,11 +238,7 @@ echo ""
 '''
         
         script_path = self.project_root / "scripts" / "access-opensearch-dashboards.sh"
-        with open(script_path, 'w') as f:
-            f.write(guide_content)
-        
-        # Make executable
-        os.chmod(script_path, 0o755)
+        FileOperations.write_executable(script_path, guide_content)
         
         return script_path
     
@@ -273,7 +264,7 @@ echo ""
         table.add_row(
             "SSH Tunnel",
             "✅ Available" if ssh_access else "❌ Not Available",
-            "https://localhost:9200/_dashboards/"
+            "http://localhost:9200/_dashboards/"
         )
         
         table.add_row(
@@ -8,7 +8,6 @@ import base64
 import click
 from datetime import datetime, timedelta
 import json
-import os
 from pathlib import Path
 import random
 import requests
@@ -37,10 +36,9 @@ class TestDataGenerator:
     def get_opensearch_credentials(self) -> tuple[str, str]:
         """Get OpenSearch credentials from Terraform outputs."""
         try:
-            os.chdir(self.terraform_dir)
-            
             result = subprocess.run(
                 ["terraform", "output", "-json"],
+                cwd=self.terraform_dir,
                 capture_output=True,
                 text=True,
                 timeout=60
@@ -59,8 +57,6 @@ class TestDataGenerator:
         except Exception as e:
             console.print(f"[red]❌ Error getting credentials: {e}[/red]")
             return None, None
-        finally:
-            os.chdir(self.project_root)
     
     def generate_login_events(self, count: int = 100) -> List[Dict]:
         """Generate sample Salesforce login events."""
@@ -4,13 +4,14 @@ Comprehensive Lab Validation Suite
 Implements: python -m setup_tools validate-lab --comprehensive
 """
 
-import os
 import sys
 import json
 import time
+import base64
 import subprocess
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Callable, Dict, List, Tuple, Optional
 import click
 import requests
 from rich.console import Console
@@ -24,6 +25,20 @@ sys.path.insert(0, str(project_root))
 
 console = Console()
 
+# Multiplex the validation SSH calls to the instance over one connection
+SSH_CONTROL_OPTIONS = [
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPath=/tmp/validate-lab-%r@%h:%p",
+    "-o", "ControlPersist=60",
+]
+
+
+@lru_cache(maxsize=4)
+def basic_auth_headers(password: str) -> Dict[str, str]:
+    """Build the os_admin Basic auth header once per password."""
+    encoded_credentials = base64.b64encode(f"os_admin:{password}".encode()).decode()
+    return {'Authorization': f'Basic {encoded_credentials}'}
+
 
 class LabValidator:
     """Comprehensive lab validation system."""
@@ -36,9 +51,9 @@ class LabValidator:
     def get_infrastructure_outputs(self) -> Dict[str, str]:
         """Get Terraform outputs."""
         try:
-            os.chdir(self.terraform_dir)
             result = subprocess.run(
                 ["terraform", "output", "-json"],
+                cwd=self.terraform_dir,
                 capture_output=True,
                 text=True,
                 timeout=60
@@ -53,14 +68,10 @@ class LabValidator:
         except Exception as e:
             console.print(f"[red]❌ Error getting outputs: {e}[/red]")
             return {}
-        finally:
-            os.chdir(self.project_root)
     
     def validate_terraform_deployment(self) -> Tuple[bool, str]:
         """Validate Terraform deployment."""
         try:
-            os.chdir(self.terraform_dir)
-            
             # Check if terraform state exists
             if not (self.terraform_dir / "terraform.tfstate").exists():
                 return False, "No Terraform state file found"
@@ -68,6 +79,7 @@ class LabValidator:
             # Run terraform plan to check for drift
             result = subprocess.run(
                 ["terraform", "plan", "-detailed-exitcode"],
+                cwd=self.terraform_dir,
                 capture_output=True,
                 text=True,
                 timeout=300
@@ -84,8 +96,6 @@ class LabValidator:
             return False, "Terraform plan timed out"
         except Exception as e:
             return False, f"Error: {e}"
-        finally:
-            os.chdir(self.project_root)
     
     def validate_ec2_instance(self, outputs: Dict[str, str]) -> Tuple[bool, str]:
         """Validate EC2 instance."""
@@ -98,38 +108,27 @@ class LabValidator:
             return False, "SSH key not found"
         
         try:
-            # Test SSH connection
+            # Test the SSH connection and the service state in one session
             result = subprocess.run(
                 [
                     "ssh", "-i", str(ssh_key),
                     "-o", "StrictHostKeyChecking=no",
                     "-o", "ConnectTimeout=10",
+                    *SSH_CONTROL_OPTIONS,
                     f"ec2-user@{ec2_ip}",
-                    "echo 'connected'"
+                    "echo connected; sudo systemctl is-active salesforce-streamer"
                 ],
                 capture_output=True,
                 text=True,
                 timeout=15
             )
             
-            if result.returncode != 0:
+            lines = result.stdout.split()
+            if lines[:1] != ["connected"]:
                 return False, f"SSH connection failed: {result.stderr}"
             
             # Check if application service is running
-            result = subprocess.run(
-                [
-                    "ssh", "-i", str(ssh_key),
-                    "-o", "StrictHostKeyChecking=no",
-                    "-o", "ConnectTimeout=10",
-                    f"ec2-user@{ec2_ip}",
-                    "sudo systemctl is-active salesforce-streamer"
-                ],
-                capture_output=True,
-                text=True,
-                timeout=15
-            )
-            
-            if result.returncode != 0 or "active" not in result.stdout:
+            if lines[1:2] != ["active"]:
                 return False, "Salesforce streamer service not active"
             
             return True, f"EC2 instance {ec2_ip} is healthy and service is running"
@@ -149,12 +148,11 @@ class LabValidator:
         
         try:
             # Test basic connectivity
-            credentials = f"os_admin:{password}"
-            encoded_credentials = base64.b64encode(credentials.encode()).decode()
+            auth_headers = basic_auth_headers(password)
             
             response = requests.get(
                 f"https://{endpoint}/",
-                headers={'Authorization': f'Basic {encoded_credentials}'},
+                headers=auth_headers,
                 timeout=30
             )
             
@@ -164,7 +162,7 @@ class LabValidator:
             # Check cluster health
             response = requests.get(
                 f"https://{endpoint}/_cluster/health",
-                headers={'Authorization': f'Basic {encoded_credentials}'},
+                headers=auth_headers,
                 timeout=30
             )
             
@@ -199,6 +197,7 @@ class LabValidator:
                     "ssh", "-i", str(ssh_key),
                     "-o", "StrictHostKeyChecking=no",
                     "-o", "ConnectTimeout=10",
+                    *SSH_CONTROL_OPTIONS,
                     f"ec2-user@{ec2_ip}",
                     "sudo journalctl -u salesforce-streamer --since '5 minutes ago' --no-pager"
                 ],
@@ -234,13 +233,12 @@ class LabValidator:
             return False, "OpenSearch credentials not available"
         
         try:
-            credentials = f"os_admin:{password}"
-            encoded_credentials = base64.b64encode(credentials.encode()).decode()
+            auth_headers = basic_auth_headers(password)
             
             # Check if the index exists
             response = requests.get(
                 f"https://{endpoint}/salesforce-login-events",
-                headers={'Authorization': f'Basic {encoded_credentials}'},
+                headers=auth_headers,
                 timeout=30
             )
             
@@ -252,7 +250,7 @@ class LabValidator:
             # Check document count
             response = requests.get(
                 f"https://{endpoint}/salesforce-login-events/_count",
-                headers={'Authorization': f'Basic {encoded_credentials}'},
+                headers=auth_headers,
                 timeout=30
             )
             
@@ -268,7 +266,7 @@ class LabValidator:
             # Check for recent documents
             response = requests.get(
                 f"https://{endpoint}/salesforce-login-events/_search?size=1&sort=@timestamp:desc",
-                headers={'Authorization': f'Basic {encoded_credentials}'},
+                headers=auth_headers,
                 timeout=30
             )
             
@@ -300,13 +298,12 @@ class LabValidator:
             return False, "OpenSearch credentials not available"
         
         try:
-            credentials = f"os_admin:{password}"
-            encoded_credentials = base64.b64encode(credentials.encode()).decode()
+            auth_headers = basic_auth_headers(password)
             
             # Test dashboard endpoint
             response = requests.get(
                 f"https://{endpoint}/_dashboards/",
-                headers={'Authorization': f'Basic {encoded_credentials}'},
+                headers=auth_headers,
                 timeout=30
             )
             
@@ -322,6 +319,25 @@ class LabValidator:
         except Exception as e:
             return False, f"Error: {e}"
     
+    def validations(self, outputs: Dict[str, str]) -> Dict[str, Tuple[str, Callable[[], Tuple[bool, str]]]]:
+        """
+        Map each component to its display name and validation check.
+        
+        Args:
+            outputs: Terraform outputs the checks run against
+        
+        Returns:
+            Dict of component key to (display name, check function)
+        """
+        return {
+            'terraform': ("Terraform Deployment", self.validate_terraform_deployment),
+            'ec2': ("EC2 Instance", partial(self.validate_ec2_instance, outputs)),
+            'opensearch': ("OpenSearch Cluster", partial(self.validate_opensearch_cluster, outputs)),
+            'salesforce': ("Salesforce Connectivity", partial(self.validate_salesforce_connectivity, outputs)),
+            'pipeline': ("Data Pipeline", partial(self.validate_data_pipeline, outputs)),
+            'dashboard': ("Dashboard Access", partial(self.validate_dashboard_access, outputs)),
+        }
+    
     def run_comprehensive_validation(self) -> Dict[str, Tuple[bool, str]]:
         """Run comprehensive validation suite."""
         console.print("[bold blue]🔍 Running Comprehensive Lab Validation[/bold blue]")
@@ -332,16 +348,6 @@ class LabValidator:
             console.print("[red]❌ No infrastructure outputs available[/red]")
             return {}
         
-        # Define validation tests
-        validations = [
-            ("Terraform Deployment", lambda: self.validate_terraform_deployment()),
-            ("EC2 Instance", lambda: self.validate_ec2_instance(outputs)),
-            ("OpenSearch Cluster", lambda: self.validate_opensearch_cluster(outputs)),
-            ("Salesforce Connectivity", lambda: self.validate_salesforce_connectivity(outputs)),
-            ("Data Pipeline", lambda: self.validate_data_pipeline(outputs)),
-            ("Dashboard Access", lambda: self.validate_dashboard_access(outputs)),
-        ]
-        
         results = {}
         
         with Progress(
@@ -352,7 +358,7 @@ class LabValidator:
             console=console
         ) as progress:
             
-            for name, validation_func in validations:
+            for name, validation_func in self.validations(outputs).values():
                 task = progress.add_task(f"Validating {name}...", total=1)
                 
                 try:
@@ -437,14 +443,7 @@ def validate_lab(comprehensive: bool, component: Optional[str]):
             console.print("[red]❌ No infrastructure outputs available[/red]")
             return
         
-        component_validators = {
-            'terraform': validator.validate_terraform_deployment,
-            'ec2': lambda: validator.validate_ec2_instance(outputs),
-            'opensearch': lambda: validator.validate_opensearch_cluster(outputs),
-            'salesforce': lambda: validator.validate_salesforce_connectivity(outputs),
-            'pipeline': lambda: validator.validate_data_pipeline(outputs),
-            'dashboard': lambda: validator.validate_dashboard_access(outputs),
-        }
+        component_validators = validator.validations(outputs)
         
         if component not in component_validators:
             console.print(f"[red]❌ Unknown component: {component}[/red]")
@@ -452,7 +451,8 @@ def validate_lab(comprehensive: bool, component: Optional[str]):
             return
         
         console.print(f"[blue]🔍 Validating {component}...[/blue]")
-        success, message = component_validators[component]()
+        _, validation_func = component_validators[component]
+        success, message = validation_func()
         
         if success:
             console.print(f"[green]✅ {component}: {message}[/green]")
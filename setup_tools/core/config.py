@@ -2,8 +2,10 @@
 Configuration management for the setup tools framework.
 """
 
+import copy
 import os
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 from dataclasses import dataclass, field
@@ -32,6 +34,7 @@ class AWSConfig:
     region: str = "us-west-2"
     ssh_key_name: str = "aws-ec2"
     ssh_key_path: str = "aws/certs/aws-ec2"
+    ssh_key_type: str = "ed25519"
     terraform_dir: str = "aws/terraform"
     terraform_vars_file: str = "aws/terraform/terraform.tfvars"
     ec2_instance_type: str = "t3.micro"
@@ -54,11 +57,36 @@ class ProjectConfig:
             self.root_dir = Path(self.root_dir)
 
 
+# Map environment variables to config keys
+ENV_MAPPINGS = {
+    'SETUP_TOOLS_LOG_LEVEL': ('log_level',),
+    'SETUP_TOOLS_DRY_RUN': ('dry_run', lambda x: x.lower() in ('true', '1', 'yes')),
+    'SETUP_TOOLS_VERBOSE': ('verbose', lambda x: x.lower() in ('true', '1', 'yes')),
+    'SETUP_TOOLS_ROOT_DIR': ('root_dir',),
+    'SF_CONTACT_EMAIL': ('salesforce', 'contact_email'),
+    'SF_ORG_NAME': ('salesforce', 'org_name'),
+    'SF_DURATION_DAYS': ('salesforce', 'duration_days', int),
+    'AWS_REGION': ('aws', 'region'),
+    'AWS_SSH_KEY_NAME': ('aws', 'ssh_key_name'),
+    'AWS_SSH_KEY_PATH': ('aws', 'ssh_key_path'),
+    'AWS_SSH_KEY_TYPE': ('aws', 'ssh_key_type'),
+}
+
+# Config file read when none is given; None means built-in defaults and
+# environment overrides only
+DEFAULT_CONFIG_FILE: Optional[Path] = None
+
+
+def _config_file_path(config_file: Optional[Union[str, Path]]) -> Optional[Path]:
+    """Return the config file that will be read for config_file, if any."""
+    return Path(config_file) if config_file else DEFAULT_CONFIG_FILE
+
+
 class ConfigManager:
     """Manages configuration loading and merging."""
     
     def __init__(self, config_file: Optional[Union[str, Path]] = None):
-        self.config_file = Path(config_file) if config_file else None
+        self.config_file = _config_file_path(config_file)
         self._config: Optional[ProjectConfig] = None
     
     def load_config(self) -> ProjectConfig:
@@ -105,6 +133,7 @@ class ConfigManager:
                 "region": "us-west-2",
                 "ssh_key_name": "aws-ec2",
                 "ssh_key_path": "aws/certs/aws-ec2",
+                "ssh_key_type": "ed25519",
                 "terraform_dir": "aws/terraform",
                 "terraform_vars_file": "aws/terraform/terraform.tfvars",
                 "ec2_instance_type": "t3.micro",
@@ -124,21 +153,7 @@ class ConfigManager:
         """Load configuration from environment variables."""
         env_config = {}
         
-        # Map environment variables to config keys
-        env_mappings = {
-            'SETUP_TOOLS_LOG_LEVEL': ('log_level',),
-            'SETUP_TOOLS_DRY_RUN': ('dry_run', lambda x: x.lower() in ('true', '1', 'yes')),
-            'SETUP_TOOLS_VERBOSE': ('verbose', lambda x: x.lower() in ('true', '1', 'yes')),
-            'SETUP_TOOLS_ROOT_DIR': ('root_dir',),
-            'SF_CONTACT_EMAIL': ('salesforce', 'contact_email'),
-            'SF_ORG_NAME': ('salesforce', 'org_name'),
-            'SF_DURATION_DAYS': ('salesforce', 'duration_days', int),
-            'AWS_REGION': ('aws', 'region'),
-            'AWS_SSH_KEY_NAME': ('aws', 'ssh_key_name'),
-            'AWS_SSH_KEY_PATH': ('aws', 'ssh_key_path'),
-        }
-        
-        for env_var, config_path in env_mappings.items():
+        for env_var, config_path in ENV_MAPPINGS.items():
             value = os.getenv(env_var)
             if value is not None:
                 # Handle nested keys
@@ -221,6 +236,7 @@ class ConfigManager:
                     'region': config.aws.region,
                     'ssh_key_name': config.aws.ssh_key_name,
                     'ssh_key_path': config.aws.ssh_key_path,
+                    'ssh_key_type': config.aws.ssh_key_type,
                     'terraform_dir': config.aws.terraform_dir,
                     'terraform_vars_file': config.aws.terraform_vars_file,
                     'ec2_instance_type': config.aws.ec2_instance_type,
@@ -236,6 +252,29 @@ class ConfigManager:
 
 
 def get_config(config_file: Optional[Union[str, Path]] = None) -> ProjectConfig:
-    """Get the global configuration instance."""
-    manager = ConfigManager(config_file)
-    return manager.load_config()
+    """
+    Get the global configuration instance.
+    
+    Configuration is loaded once per config file, working directory and set of
+    environment overrides; editing the config file invalidates the cached copy.
+    Each caller gets its own copy, so changes to it don't leak to later callers.
+    Call clear_config_cache() to force a reload.
+    """
+    # Key on the file actually read, so the default file's edits count too
+    config_path = _config_file_path(config_file)
+    config_path = config_path.resolve() if config_path else None
+    mtime = config_path.stat().st_mtime_ns if config_path and config_path.exists() else None
+    env = tuple((name, os.environ.get(name)) for name in ENV_MAPPINGS)
+    return copy.deepcopy(_load_config(config_path, mtime, Path.cwd(), env))
+
+
+def clear_config_cache() -> None:
+    """Drop cached configuration so the next get_config() reloads it."""
+    _load_config.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _load_config(config_path: Optional[Path], mtime: Optional[int], cwd: Path,
+                 env: tuple) -> ProjectConfig:
+    """Load configuration; the extra arguments only key the cache."""
+    return ConfigManager(config_path).load_config()
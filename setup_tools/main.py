@@ -19,7 +19,7 @@ from .commands.salesforce.create_integration_user import CreateIntegrationUserCo
 from .commands.salesforce.setup_complete import SetupCompleteSalesforceCommand
 from .commands.salesforce.setup_connected_app import SetupConnectedAppCommand
 from .commands.aws.generate_certificate import GenerateAWSCertificateCommand
-from .commands.infrastructure.deploy_complete_lab import deploy_complete_lab
+from .commands.infrastructure.deploy_complete_lab import deploy_complete_lab, TERRAFORM_PARALLELISM
 from .commands.infrastructure.setup_terraform_vars import setup_terraform_vars
 from .commands.services.access_dashboards import access_dashboards
 from .commands.validation.validate_lab import validate_lab
@@ -383,10 +383,26 @@ def aws_generate_certificate(ctx, key_name):
 @click.option('--dry-run', is_flag=True, help='Preview operations without executing')
 @click.option('--validate', is_flag=True, help='Run validation after deployment')
 @click.option('--skip-prereqs', is_flag=True, help='Skip prerequisite validation')
+@click.option('--skip-refresh', is_flag=True,
+              help='Plan against the existing state without refreshing it from AWS')
+@click.option('--no-prereq-cache', is_flag=True,
+              help='Run prerequisite checks even if they passed in the last 10 minutes')
+@click.option('--parallelism', type=click.IntRange(min=1), default=TERRAFORM_PARALLELISM,
+              show_default=True, help='Concurrent Terraform resource operations')
 @click.pass_context
-def infrastructure_deploy_complete_lab(ctx, environment, config, dry_run, validate, skip_prereqs):
+def infrastructure_deploy_complete_lab(ctx, environment, config, dry_run, validate, skip_prereqs,
+                                       skip_refresh, no_prereq_cache, parallelism):
     """Deploy complete lab infrastructure and application."""
-    deploy_complete_lab.callback(environment, config, dry_run, validate, skip_prereqs)
+    deploy_complete_lab.callback(
+        environment=environment,
+        config=config,
+        dry_run=dry_run,
+        validate=validate,
+        skip_prereqs=skip_prereqs,
+        skip_refresh=skip_refresh,
+        no_prereq_cache=no_prereq_cache,
+        parallelism=parallelism
+    )
 
 
 @infrastructure.command('setup-terraform-vars')
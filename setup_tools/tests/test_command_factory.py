@@ -0,0 +1,51 @@
+"""
+Tests for command registration and metadata.
+"""
+
+import inspect
+import pytest
+import setup_tools.commands  # noqa: F401  registers every command
+from setup_tools.commands.aws.generate_certificate import GenerateAWSCertificateCommand
+from setup_tools.commands.base import BaseCommand, CommandFactory
+from setup_tools.core.exceptions import CommandError
+
+
+@pytest.fixture
+def no_instances(monkeypatch):
+    """Fail the test if any command gets instantiated."""
+    def refuse(self, *args, **kwargs):
+        raise AssertionError(f"{type(self).__name__} was instantiated")
+    
+    monkeypatch.setattr(BaseCommand, "__init__", refuse)
+
+
+class TestCommandFactory:
+    """Test cases for CommandFactory metadata lookups."""
+    
+    def test_metadata_methods_are_classmethods(self):
+        """Test every registered command exposes its metadata as classmethods."""
+        assert CommandFactory._commands
+        for command_class in CommandFactory._commands.values():
+            for method in ("get_description", "get_required_args", "get_optional_args"):
+                assert isinstance(inspect.getattr_static(command_class, method), classmethod), \
+                    f"{command_class.__name__}.{method} is not a classmethod"
+    
+    def test_list_commands_without_instantiating(self, no_instances):
+        """Test listing commands reads descriptions from the classes."""
+        commands = CommandFactory.list_commands()
+        
+        assert set(commands) == set(CommandFactory._commands)
+        assert commands["aws:generate-certificate"] == "Generate SSH keypair for AWS EC2 instances"
+    
+    def test_get_command_info_without_instantiating(self, no_instances):
+        """Test command info is built from the class."""
+        info = CommandFactory.get_command_info("aws:generate-certificate")
+        
+        assert info["required_args"] == []
+        assert "key_name" in info["optional_args"]
+        assert info["class"] is GenerateAWSCertificateCommand
+    
+    def test_get_command_info_unknown(self):
+        """Test unknown commands raise CommandError."""
+        with pytest.raises(CommandError):
+            CommandFactory.get_command_info("no:such-command")
@@ -0,0 +1,93 @@
+"""
+Tests for configuration loading and caching.
+"""
+
+import os
+import pytest
+from setup_tools.core import config as config_module
+from setup_tools.core.config import ConfigManager, get_config, clear_config_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_config_cache(monkeypatch):
+    """Start each test with an empty config cache and no env overrides."""
+    monkeypatch.delenv("SF_ORG_NAME", raising=False)
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Write a minimal YAML config file."""
+    path = tmp_path / "config.yaml"
+    path.write_text("salesforce:\n  org_name: from-file\n")
+    return path
+
+
+class TestGetConfig:
+    """Test cases for the cached get_config."""
+    
+    def test_loads_file(self, config_file):
+        """Test values from the config file are applied."""
+        assert get_config(config_file).salesforce.org_name == "from-file"
+    
+    def test_reloads_when_file_changes(self, config_file):
+        """Test editing the config file invalidates the cached copy."""
+        assert get_config(config_file).salesforce.org_name == "from-file"
+        
+        config_file.write_text("salesforce:\n  org_name: edited\n")
+        # Make sure the mtime moves even on filesystems with coarse timestamps
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert get_config(config_file).salesforce.org_name == "edited"
+    
+    def test_reloads_when_default_file_changes(self, config_file, monkeypatch):
+        """Test editing the default config file invalidates the cached copy."""
+        monkeypatch.setattr(config_module, "DEFAULT_CONFIG_FILE", config_file)
+        assert get_config().salesforce.org_name == "from-file"
+        
+        config_file.write_text("salesforce:\n  org_name: edited\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert get_config().salesforce.org_name == "edited"
+    
+    def test_reloads_when_env_changes(self, config_file, monkeypatch):
+        """Test environment overrides are picked up without clearing the cache."""
+        assert get_config(config_file).salesforce.org_name == "from-file"
+        
+        monkeypatch.setenv("SF_ORG_NAME", "from-env")
+        
+        assert get_config(config_file).salesforce.org_name == "from-env"
+    
+    def test_mutation_does_not_leak(self, config_file):
+        """Test changes to a returned config are not seen by later callers."""
+        config = get_config(config_file)
+        config.dry_run = True
+        config.salesforce.org_name = "mutated"
+        
+        fresh = get_config(config_file)
+        assert fresh is not config
+        assert fresh.dry_run is False
+        assert fresh.salesforce.org_name == "from-file"
+    
+    def test_clear_config_cache(self, config_file, monkeypatch):
+        """Test clear_config_cache forces the file to be read again."""
+        get_config(config_file)
+        calls = []
+        original = ConfigManager.load_config
+        
+        def counting_load(self):
+            calls.append(self.config_file)
+            return original(self)
+        
+        monkeypatch.setattr(ConfigManager, "load_config", counting_load)
+        
+        get_config(config_file)
+        assert calls == []
+        
+        clear_config_cache()
+        get_config(config_file)
+        assert calls == [config_file]
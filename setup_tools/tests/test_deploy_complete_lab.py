@@ -0,0 +1,64 @@
+"""
+Tests for reading Terraform outputs in deploy-complete-lab.
+"""
+
+import json
+import pytest
+from setup_tools.commands.infrastructure.deploy_complete_lab import (
+    LabDeploymentManager,
+    TERRAFORM_STATE_VERSION,
+)
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Create a manager whose Terraform directory is a temporary directory."""
+    monkeypatch.delenv("TF_WORKSPACE", raising=False)
+    manager = LabDeploymentManager(dry_run=True)
+    manager.terraform_dir = tmp_path
+    return manager
+
+
+def write_state(terraform_dir, version, outputs):
+    """Write a local terraform.tfstate with the given outputs."""
+    state = {
+        "version": version,
+        "outputs": {name: {"value": value, "type": "string"} for name, value in outputs.items()},
+    }
+    (terraform_dir / "terraform.tfstate").write_text(json.dumps(state))
+
+
+class TestReadStateOutputs:
+    """Test cases for reading outputs straight from the state file."""
+    
+    def test_supported_version(self, manager):
+        """Test outputs are read from a state file in the supported format."""
+        write_state(manager.terraform_dir, TERRAFORM_STATE_VERSION, {"ec2_public_ip": "203.0.113.10"})
+        
+        assert manager._read_state_outputs() == {"ec2_public_ip": "203.0.113.10"}
+    
+    @pytest.mark.parametrize("version", [3, 5, None])
+    def test_unsupported_version(self, manager, version):
+        """Test an unknown state version falls back instead of guessing the layout."""
+        write_state(manager.terraform_dir, version, {"ec2_public_ip": "203.0.113.10"})
+        
+        assert manager._read_state_outputs() is None
+    
+    def test_missing_state(self, manager):
+        """Test a missing state file falls back."""
+        assert manager._read_state_outputs() is None
+    
+    def test_backend_configured(self, manager):
+        """Test state behind a configured backend is not read from disk."""
+        write_state(manager.terraform_dir, TERRAFORM_STATE_VERSION, {"ec2_public_ip": "203.0.113.10"})
+        (manager.terraform_dir / ".terraform").mkdir()
+        (manager.terraform_dir / ".terraform" / "terraform.tfstate").write_text("{}")
+        
+        assert manager._read_state_outputs() is None
+    
+    def test_non_default_workspace(self, manager, monkeypatch):
+        """Test a selected workspace falls back to terraform output."""
+        write_state(manager.terraform_dir, TERRAFORM_STATE_VERSION, {"ec2_public_ip": "203.0.113.10"})
+        monkeypatch.setenv("TF_WORKSPACE", "staging")
+        
+        assert manager._read_state_outputs() is None
@@ -0,0 +1,35 @@
+"""
+Tests for file operation utilities.
+"""
+
+import os
+import stat
+from setup_tools.utils.file_operations import FileOperations
+
+
+class TestWriteExecutable:
+    """Test cases for FileOperations.write_executable."""
+    
+    def test_creates_executable(self, tmp_path):
+        """Test the file is written with mode 0o755 even under a restrictive umask."""
+        path = tmp_path / "script.sh"
+        old_umask = os.umask(0o077)
+        try:
+            FileOperations.write_executable(path, "#!/bin/bash\necho ok\n")
+        finally:
+            os.umask(old_umask)
+        
+        assert path.read_text() == "#!/bin/bash\necho ok\n"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o755
+    
+    def test_replaces_existing_file(self, tmp_path):
+        """Test an existing file is replaced and no temporary file is left behind."""
+        path = tmp_path / "script.sh"
+        path.write_text("old")
+        path.chmod(0o644)
+        
+        FileOperations.write_executable(path, "new")
+        
+        assert path.read_text() == "new"
+        assert stat.S_IMODE(path.stat().st_mode) == 0o755
+        assert os.listdir(tmp_path) == ["script.sh"]
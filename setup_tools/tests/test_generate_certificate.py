@@ -0,0 +1,60 @@
+"""
+Tests for the aws:generate-certificate command.
+"""
+
+import shutil
+import subprocess
+import pytest
+from setup_tools.core.config import ProjectConfig
+from setup_tools.core.exceptions import ValidationError
+from setup_tools.commands.aws.generate_certificate import GenerateAWSCertificateCommand
+
+
+@pytest.fixture
+def command():
+    """Create a dry-run certificate command with default configuration."""
+    return GenerateAWSCertificateCommand(ProjectConfig(), dry_run=True)
+
+
+class TestKeyFingerprint:
+    """Test cases for the in-process SSH key fingerprint."""
+    
+    @pytest.mark.skipif(shutil.which("ssh-keygen") is None, reason="ssh-keygen not installed")
+    @pytest.mark.parametrize("key_type", ["ed25519", "rsa"])
+    def test_matches_ssh_keygen(self, command, tmp_path, key_type):
+        """Test the fingerprint matches `ssh-keygen -lf` for each supported key type."""
+        private_key_path = tmp_path / "test-key"
+        subprocess.run(
+            ["ssh-keygen", *command.KEY_TYPE_ARGS[key_type], "-f", str(private_key_path),
+             "-N", "", "-C", "lab@example.com", "-q"],
+            check=True
+        )
+        public_key_path = tmp_path / "test-key.pub"
+        
+        expected = subprocess.run(
+            ["ssh-keygen", "-lf", str(public_key_path)],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+        
+        assert command._get_key_fingerprint(public_key_path) == expected
+    
+    def test_unreadable_key_returns_none(self, command, tmp_path):
+        """Test a malformed public key yields None instead of raising."""
+        public_key_path = tmp_path / "broken.pub"
+        public_key_path.write_text("not-a-key")
+        
+        assert command._get_key_fingerprint(public_key_path) is None
+
+
+class TestValidateInputs:
+    """Test cases for certificate command input validation."""
+    
+    @pytest.mark.parametrize("key_type", ["ed25519", "rsa"])
+    def test_supported_key_types(self, command, key_type):
+        """Test supported key types are accepted."""
+        command.validate_inputs(key_name="aws-ec2", key_type=key_type)
+    
+    def test_unknown_key_type(self, command):
+        """Test an unknown ssh_key_type is rejected."""
+        with pytest.raises(ValidationError, match="Unsupported SSH key type 'dsa'"):
+            command.validate_inputs(key_name="aws-ec2", key_type="dsa")
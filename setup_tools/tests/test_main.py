@@ -0,0 +1,66 @@
+"""
+Tests for the setup-tools CLI wrappers.
+"""
+
+import pytest
+from click.testing import CliRunner
+from setup_tools.main import cli
+from setup_tools.commands.infrastructure import deploy_complete_lab
+
+
+class StopDeployment(Exception):
+    """Raised by the recording manager to end the command early."""
+
+
+@pytest.fixture
+def recorded_manager(monkeypatch):
+    """Replace the deployment manager with one that records its arguments."""
+    calls = []
+    
+    def record(*args, **kwargs):
+        calls.append((args, kwargs))
+        raise StopDeployment()
+    
+    monkeypatch.setattr(deploy_complete_lab, "LabDeploymentManager", record)
+    return calls
+
+
+class TestDeployCompleteLab:
+    """Test cases for infrastructure deploy-complete-lab through the cli group."""
+    
+    def test_dry_run(self):
+        """Test a dry run completes through the wrapper."""
+        result = CliRunner().invoke(
+            cli, ["infrastructure", "deploy-complete-lab", "--dry-run", "--skip-prereqs"]
+        )
+        
+        assert result.exit_code == 0, result.output
+        assert "DRY RUN: Would deploy infrastructure" in result.output
+    
+    def test_defaults_forwarded(self, recorded_manager):
+        """Test the wrapper passes the command's defaults to the manager."""
+        result = CliRunner().invoke(cli, ["infrastructure", "deploy-complete-lab", "--dry-run"])
+        
+        assert isinstance(result.exception, StopDeployment)
+        assert recorded_manager == [
+            ((None, True, False),
+             {"prereq_cache": True, "terraform_parallelism": deploy_complete_lab.TERRAFORM_PARALLELISM})
+        ]
+    
+    def test_options_forwarded(self, recorded_manager):
+        """Test every deploy option given to the wrapper reaches the manager."""
+        result = CliRunner().invoke(cli, [
+            "infrastructure", "deploy-complete-lab", "--dry-run",
+            "--skip-refresh", "--no-prereq-cache", "--parallelism", "7"
+        ])
+        
+        assert isinstance(result.exception, StopDeployment)
+        assert recorded_manager == [
+            ((None, True, True), {"prereq_cache": False, "terraform_parallelism": 7})
+        ]
+    
+    def test_parallelism_must_be_positive(self):
+        """Test --parallelism rejects values below one."""
+        result = CliRunner().invoke(cli, ["infrastructure", "deploy-complete-lab", "--parallelism", "0"])
+        
+        assert result.exit_code == 2
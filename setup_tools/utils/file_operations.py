@@ -2,6 +2,7 @@
 File operation utilities.
 """
 
+import os
 import shutil
 import tempfile
 from pathlib import Path
@@ -130,6 +131,34 @@ class FileOperations:
         except Exception as e:
             raise FileOperationError(f"Failed to write file {path}: {e}")
     
+    @staticmethod
+    def write_executable(path: Union[str, Path], content: str) -> None:
+        """
+        Atomically write a file that is executable from the moment it appears.
+        
+        The content goes to a temporary file created with mode 0o755, which
+        then replaces the target, so there is no window where the file exists
+        with the wrong mode or partial content.
+        
+        Args:
+            path: File path
+            content: Content to write
+            
+        Raises:
+            FileOperationError: If file write fails
+        """
+        path = Path(path)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+            with open(fd, 'w', encoding='utf-8') as f:
+                os.fchmod(fd, 0o755)  # the mode passed to os.open is masked by the umask
+                f.write(content)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            raise FileOperationError(f"Failed to write file {path}: {e}")
+    
     @staticmethod
     def replace_in_file(
         path: Union[str, Path],